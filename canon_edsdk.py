@@ -9,9 +9,19 @@ allowing control of Canon cameras from Python.
 import ctypes
 from ctypes import *
 from ctypes import WINFUNCTYPE  # For Windows stdcall callbacks
+from ctypes import string_at
+from ctypes import wintypes
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+from functools import lru_cache
+from collections import deque, namedtuple
 from enum import IntEnum
+import logging
 import platform
 import os
+import random
+import queue
+import threading
+import time
 
 # Load the EDSDK DLL
 if platform.system() == 'Windows':
@@ -21,9 +31,13 @@ if platform.system() == 'Windows':
     except OSError:
         # Fall back to system path
         edsdk = ctypes.WinDLL('EDSDK.dll')
+    user32 = ctypes.WinDLL('user32')
+    ole32 = ctypes.WinDLL('ole32')
 else:
     raise OSError("This wrapper currently only supports Windows. For Mac/Linux, use CDLL with appropriate library.")
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # Basic Type Definitions
@@ -102,6 +116,9 @@ class EdsErrorCodes:
     EDS_ERR_TAKE_PICTURE_AF_NG = 0x00008D01
     EDS_ERR_TAKE_PICTURE_NO_CARD_NG = 0x00008D06
     EDS_ERR_TAKE_PICTURE_CARD_NG = 0x00008D07
+    
+    # Object errors
+    EDS_ERR_OBJECT_NOTREADY = 0x0000A102
 
     @staticmethod
     def get_error_name(error_code):
@@ -187,6 +204,13 @@ class EdsFileCreateDisposition(IntEnum):
     TruncateExisting = 5
 
 
+class EdsSeekOrigin(IntEnum):
+    """Stream seek origin"""
+    Cur = 0
+    Begin = 1
+    End = 2
+
+
 class EdsAccess(IntEnum):
     """File access modes"""
     Read = 0
@@ -201,11 +225,21 @@ class EdsCameraCommand(IntEnum):
     ExtendShutDownTimer = 0x00000001
     BulbStart = 0x00000002
     BulbEnd = 0x00000003
+    PressShutterButton = 0x00000004
     DoEvfAf = 0x00000102
     DriveLensEvf = 0x00000103
     DoClickWBEvf = 0x00000104
 
 
+class EdsShutterButton(IntEnum):
+    """Shutter button states for PressShutterButton"""
+    OFF = 0x00000000
+    Halfway = 0x00000001
+    Completely = 0x00000003
+    Halfway_NonAF = 0x00010001
+    Completely_NonAF = 0x00010003
+
+
 class EdsEvfOutputDevice(IntEnum):
     """EVF (Live View) output device"""
     TFT = 1
@@ -370,175 +404,141 @@ else:
 # SDK Function Definitions
 # =============================================================================
 
-# Basic Functions
-EdsInitializeSDK = edsdk.EdsInitializeSDK
-EdsInitializeSDK.argtypes = []
-EdsInitializeSDK.restype = EdsError
-
-EdsTerminateSDK = edsdk.EdsTerminateSDK
-EdsTerminateSDK.argtypes = []
-EdsTerminateSDK.restype = EdsError
-
-# Reference Counter Functions
-EdsRetain = edsdk.EdsRetain
-EdsRetain.argtypes = [EdsBaseRef]
-EdsRetain.restype = EdsUInt32
-
-EdsRelease = edsdk.EdsRelease
-EdsRelease.argtypes = [EdsBaseRef]
-EdsRelease.restype = EdsUInt32
-
-# Item-tree Functions
-EdsGetChildCount = edsdk.EdsGetChildCount
-EdsGetChildCount.argtypes = [EdsBaseRef, POINTER(EdsUInt32)]
-EdsGetChildCount.restype = EdsError
-
-EdsGetChildAtIndex = edsdk.EdsGetChildAtIndex
-EdsGetChildAtIndex.argtypes = [EdsBaseRef, EdsInt32, POINTER(EdsBaseRef)]
-EdsGetChildAtIndex.restype = EdsError
-
-EdsGetParent = edsdk.EdsGetParent
-EdsGetParent.argtypes = [EdsBaseRef, POINTER(EdsBaseRef)]
-EdsGetParent.restype = EdsError
-
-# Property Functions
-EdsGetPropertySize = edsdk.EdsGetPropertySize
-EdsGetPropertySize.argtypes = [EdsBaseRef, EdsPropertyID, EdsInt32, 
-                                POINTER(EdsUInt32), POINTER(EdsInt32)]
-EdsGetPropertySize.restype = EdsError
-
-EdsGetPropertyData = edsdk.EdsGetPropertyData
-EdsGetPropertyData.argtypes = [EdsBaseRef, EdsPropertyID, EdsInt32, 
-                                EdsInt32, c_void_p]
-EdsGetPropertyData.restype = EdsError
-
-EdsSetPropertyData = edsdk.EdsSetPropertyData
-EdsSetPropertyData.argtypes = [EdsBaseRef, EdsPropertyID, EdsInt32, 
-                                EdsInt32, c_void_p]
-EdsSetPropertyData.restype = EdsError
-
-EdsGetPropertyDesc = edsdk.EdsGetPropertyDesc
-EdsGetPropertyDesc.argtypes = [EdsBaseRef, EdsPropertyID, POINTER(EdsPropertyDesc)]
-EdsGetPropertyDesc.restype = EdsError
-
-# Camera List and Device Functions
-EdsGetCameraList = edsdk.EdsGetCameraList
-EdsGetCameraList.argtypes = [POINTER(EdsCameraListRef)]
-EdsGetCameraList.restype = EdsError
-
-EdsGetDeviceInfo = edsdk.EdsGetDeviceInfo
-EdsGetDeviceInfo.argtypes = [EdsCameraRef, POINTER(EdsDeviceInfo)]
-EdsGetDeviceInfo.restype = EdsError
-
-# Session Functions
-EdsOpenSession = edsdk.EdsOpenSession
-EdsOpenSession.argtypes = [EdsCameraRef]
-EdsOpenSession.restype = EdsError
-
-EdsCloseSession = edsdk.EdsCloseSession
-EdsCloseSession.argtypes = [EdsCameraRef]
-EdsCloseSession.restype = EdsError
-
-# Command Functions
-EdsSendCommand = edsdk.EdsSendCommand
-EdsSendCommand.argtypes = [EdsCameraRef, EdsUInt32, EdsInt32]
-EdsSendCommand.restype = EdsError
-
-EdsSendStatusCommand = edsdk.EdsSendStatusCommand
-EdsSendStatusCommand.argtypes = [EdsCameraRef, EdsUInt32, EdsInt32]
-EdsSendStatusCommand.restype = EdsError
-
-EdsSetCapacity = edsdk.EdsSetCapacity
-EdsSetCapacity.argtypes = [EdsCameraRef, EdsCapacity]
-EdsSetCapacity.restype = EdsError
-
-# Volume Functions
-EdsGetVolumeInfo = edsdk.EdsGetVolumeInfo
-EdsGetVolumeInfo.argtypes = [EdsVolumeRef, POINTER(EdsVolumeInfo)]
-EdsGetVolumeInfo.restype = EdsError
-
-# Directory Item Functions
-EdsGetDirectoryItemInfo = edsdk.EdsGetDirectoryItemInfo
-EdsGetDirectoryItemInfo.argtypes = [EdsDirectoryItemRef, POINTER(EdsDirectoryItemInfo)]
-EdsGetDirectoryItemInfo.restype = EdsError
-
-EdsDeleteDirectoryItem = edsdk.EdsDeleteDirectoryItem
-EdsDeleteDirectoryItem.argtypes = [EdsDirectoryItemRef]
-EdsDeleteDirectoryItem.restype = EdsError
-
-# Download Functions
-EdsDownload = edsdk.EdsDownload
-EdsDownload.argtypes = [EdsDirectoryItemRef, EdsUInt64, EdsStreamRef]
-EdsDownload.restype = EdsError
-
-EdsDownloadComplete = edsdk.EdsDownloadComplete
-EdsDownloadComplete.argtypes = [EdsDirectoryItemRef]
-EdsDownloadComplete.restype = EdsError
-
-EdsDownloadCancel = edsdk.EdsDownloadCancel
-EdsDownloadCancel.argtypes = [EdsDirectoryItemRef]
-EdsDownloadCancel.restype = EdsError
-
-# Stream Functions
-EdsCreateFileStream = edsdk.EdsCreateFileStream
-EdsCreateFileStream.argtypes = [c_char_p, EdsUInt32, EdsUInt32, POINTER(EdsStreamRef)]
-EdsCreateFileStream.restype = EdsError
-
-# Unicode version for Windows (handles long paths and Unicode filenames better)
-EdsCreateFileStreamEx = edsdk.EdsCreateFileStreamEx
-EdsCreateFileStreamEx.argtypes = [c_wchar_p, EdsUInt32, EdsUInt32, POINTER(EdsStreamRef)]
-EdsCreateFileStreamEx.restype = EdsError
-
-EdsCreateMemoryStream = edsdk.EdsCreateMemoryStream
-EdsCreateMemoryStream.argtypes = [EdsUInt64, POINTER(EdsStreamRef)]
-EdsCreateMemoryStream.restype = EdsError
-
-EdsGetPointer = edsdk.EdsGetPointer
-EdsGetPointer.argtypes = [EdsStreamRef, POINTER(c_void_p)]
-EdsGetPointer.restype = EdsError
-
-EdsGetLength = edsdk.EdsGetLength
-EdsGetLength.argtypes = [EdsStreamRef, POINTER(EdsUInt64)]
-EdsGetLength.restype = EdsError
-
-# Event Handler Functions
-EdsSetCameraAddedHandler = edsdk.EdsSetCameraAddedHandler
-EdsSetCameraAddedHandler.argtypes = [EdsCameraAddedHandler, c_void_p]
-EdsSetCameraAddedHandler.restype = EdsError
-
-EdsSetPropertyEventHandler = edsdk.EdsSetPropertyEventHandler
-EdsSetPropertyEventHandler.argtypes = [EdsCameraRef, EdsUInt32, 
-                                        EdsPropertyEventHandler, c_void_p]
-EdsSetPropertyEventHandler.restype = EdsError
-
-EdsSetObjectEventHandler = edsdk.EdsSetObjectEventHandler
-EdsSetObjectEventHandler.argtypes = [EdsCameraRef, EdsUInt32, 
-                                      EdsObjectEventHandler, c_void_p]
-EdsSetObjectEventHandler.restype = EdsError
-
-EdsSetCameraStateEventHandler = edsdk.EdsSetCameraStateEventHandler
-EdsSetCameraStateEventHandler.argtypes = [EdsCameraRef, EdsUInt32, 
-                                           EdsStateEventHandler, c_void_p]
-EdsSetCameraStateEventHandler.restype = EdsError
-
-EdsGetEvent = edsdk.EdsGetEvent
-EdsGetEvent.argtypes = []
-EdsGetEvent.restype = EdsError
-
-# EVF (Live View) Functions
-EdsCreateEvfImageRef = edsdk.EdsCreateEvfImageRef
-EdsCreateEvfImageRef.argtypes = [EdsStreamRef, POINTER(EdsEvfImageRef)]
-EdsCreateEvfImageRef.restype = EdsError
-
-EdsDownloadEvfImage = edsdk.EdsDownloadEvfImage
-EdsDownloadEvfImage.argtypes = [EdsCameraRef, EdsEvfImageRef]
-EdsDownloadEvfImage.restype = EdsError
+# (name, argtypes, restype) for every SDK function used by this wrapper
+_PROTOTYPES = (
+    # Basic Functions
+    ('EdsInitializeSDK', (), EdsError),
+    ('EdsTerminateSDK', (), EdsError),
+    
+    # Reference Counter Functions
+    ('EdsRetain', (EdsBaseRef,), EdsUInt32),
+    ('EdsRelease', (EdsBaseRef,), EdsUInt32),
+    
+    # Item-tree Functions
+    ('EdsGetChildCount', (EdsBaseRef, POINTER(EdsUInt32)), EdsError),
+    ('EdsGetChildAtIndex', (EdsBaseRef, EdsInt32, POINTER(EdsBaseRef)), EdsError),
+    ('EdsGetParent', (EdsBaseRef, POINTER(EdsBaseRef)), EdsError),
+    
+    # Property Functions
+    ('EdsGetPropertySize', (EdsBaseRef, EdsPropertyID, EdsInt32,
+                            POINTER(EdsUInt32), POINTER(EdsInt32)), EdsError),
+    ('EdsGetPropertyData', (EdsBaseRef, EdsPropertyID, EdsInt32,
+                            EdsInt32, c_void_p), EdsError),
+    ('EdsSetPropertyData', (EdsBaseRef, EdsPropertyID, EdsInt32,
+                            EdsInt32, c_void_p), EdsError),
+    ('EdsGetPropertyDesc', (EdsBaseRef, EdsPropertyID, POINTER(EdsPropertyDesc)), EdsError),
+    
+    # Camera List and Device Functions
+    ('EdsGetCameraList', (POINTER(EdsCameraListRef),), EdsError),
+    ('EdsGetDeviceInfo', (EdsCameraRef, POINTER(EdsDeviceInfo)), EdsError),
+    
+    # Session Functions
+    ('EdsOpenSession', (EdsCameraRef,), EdsError),
+    ('EdsCloseSession', (EdsCameraRef,), EdsError),
+    
+    # Command Functions
+    ('EdsSendCommand', (EdsCameraRef, EdsUInt32, EdsInt32), EdsError),
+    ('EdsSendStatusCommand', (EdsCameraRef, EdsUInt32, EdsInt32), EdsError),
+    ('EdsSetCapacity', (EdsCameraRef, EdsCapacity), EdsError),
+    
+    # Volume Functions
+    ('EdsGetVolumeInfo', (EdsVolumeRef, POINTER(EdsVolumeInfo)), EdsError),
+    
+    # Directory Item Functions
+    ('EdsGetDirectoryItemInfo', (EdsDirectoryItemRef, POINTER(EdsDirectoryItemInfo)), EdsError),
+    ('EdsDeleteDirectoryItem', (EdsDirectoryItemRef,), EdsError),
+    
+    # Download Functions
+    ('EdsDownload', (EdsDirectoryItemRef, EdsUInt64, EdsStreamRef), EdsError),
+    ('EdsDownloadComplete', (EdsDirectoryItemRef,), EdsError),
+    ('EdsDownloadCancel', (EdsDirectoryItemRef,), EdsError),
+    
+    # Stream Functions
+    ('EdsCreateFileStream', (c_char_p, EdsUInt32, EdsUInt32, POINTER(EdsStreamRef)), EdsError),
+    # Unicode version for Windows (handles long paths and Unicode filenames better)
+    ('EdsCreateFileStreamEx', (c_wchar_p, EdsUInt32, EdsUInt32, POINTER(EdsStreamRef)), EdsError),
+    ('EdsCreateMemoryStream', (EdsUInt64, POINTER(EdsStreamRef)), EdsError),
+    ('EdsGetPointer', (EdsStreamRef, POINTER(c_void_p)), EdsError),
+    ('EdsGetLength', (EdsStreamRef, POINTER(EdsUInt64)), EdsError),
+    ('EdsGetPosition', (EdsStreamRef, POINTER(EdsUInt64)), EdsError),
+    ('EdsSeek', (EdsStreamRef, EdsInt64, EdsUInt32), EdsError),
+    
+    # Event Handler Functions
+    ('EdsSetCameraAddedHandler', (EdsCameraAddedHandler, c_void_p), EdsError),
+    ('EdsSetPropertyEventHandler', (EdsCameraRef, EdsUInt32,
+                                    EdsPropertyEventHandler, c_void_p), EdsError),
+    ('EdsSetObjectEventHandler', (EdsCameraRef, EdsUInt32,
+                                  EdsObjectEventHandler, c_void_p), EdsError),
+    ('EdsSetCameraStateEventHandler', (EdsCameraRef, EdsUInt32,
+                                       EdsStateEventHandler, c_void_p), EdsError),
+    ('EdsGetEvent', (), EdsError),
+    
+    # EVF (Live View) Functions
+    ('EdsCreateEvfImageRef', (EdsStreamRef, POINTER(EdsEvfImageRef)), EdsError),
+    ('EdsDownloadEvfImage', (EdsCameraRef, EdsEvfImageRef), EdsError),
+)
+
+_module_globals = globals()
+for _name, _argtypes, _restype in _PROTOTYPES:
+    _func = getattr(edsdk, _name)
+    _func.argtypes = list(_argtypes)
+    _func.restype = _restype
+    _module_globals[_name] = _func
+del _module_globals, _name, _argtypes, _restype, _func
+
+# Refs handed out by EdsGetChildAtIndex and not yet released. Only filled in
+# when EDSDK_TRACK_REFS is set, so normal runs keep the raw SDK functions.
+_open_refs = set()
+
+if os.environ.get('EDSDK_TRACK_REFS'):
+    _raw_get_child_at_index = EdsGetChildAtIndex
+    _raw_release = EdsRelease
+    
+    def EdsGetChildAtIndex(parent, index, out_ref):
+        err = _raw_get_child_at_index(parent, index, out_ref)
+        if err == EdsErrorCodes.EDS_ERR_OK:
+            _open_refs.add(out_ref._obj.value)
+        return err
+    
+    def EdsRelease(ref):
+        _open_refs.discard(ref.value if isinstance(ref, c_void_p) else ref)
+        return _raw_release(ref)
+
+# Win32 message wait used by process_events() to sleep until the SDK posts
+_MsgWaitForMultipleObjectsEx = user32.MsgWaitForMultipleObjectsEx
+_MsgWaitForMultipleObjectsEx.argtypes = [wintypes.DWORD, POINTER(wintypes.HANDLE),
+                                         wintypes.DWORD, wintypes.DWORD, wintypes.DWORD]
+_MsgWaitForMultipleObjectsEx.restype = wintypes.DWORD
+_PeekMessageW = user32.PeekMessageW
+_PeekMessageW.argtypes = [POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT,
+                          wintypes.UINT, wintypes.UINT]
+_PeekMessageW.restype = wintypes.BOOL
+_TranslateMessage = user32.TranslateMessage
+_TranslateMessage.argtypes = [POINTER(wintypes.MSG)]
+_DispatchMessageW = user32.DispatchMessageW
+_DispatchMessageW.argtypes = [POINTER(wintypes.MSG)]
+
+_QS_ALLINPUT = 0x04FF
+_MWMO_INPUTAVAILABLE = 0x0004
+_PM_REMOVE = 0x0001
+_WAIT_OBJECT_0 = 0x00000000
+
+# Worker threads that call into the SDK join the multithreaded COM apartment
+_CoInitializeEx = ole32.CoInitializeEx
+_CoInitializeEx.argtypes = [c_void_p, wintypes.DWORD]
+_CoInitializeEx.restype = c_long
+_COINIT_MULTITHREADED = 0x0
 
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
+def _init_sdk_thread():
+    """Initialize COM on a worker thread before it makes SDK calls"""
+    _CoInitializeEx(None, _COINIT_MULTITHREADED)
+
+
 def check_error(err, func_name=""):
     """Check error code and raise exception if not OK"""
     if err != EdsErrorCodes.EDS_ERR_OK:
@@ -549,20 +549,79 @@ def check_error(err, func_name=""):
             raise RuntimeError(f"SDK Error: {error_name} (0x{err:08X})")
 
 
-def get_property_uint32(camera_ref, property_id, param=0):
-    """Helper to get a UInt32 property"""
+def _decode_sdk_string(raw):
+    """Decode a fixed-size SDK char field, stopping at the first NUL"""
+    return raw.split(b'\x00', 1)[0].decode('utf-8', errors='ignore')
+
+
+_MISSING = object()
+
+
+def _ref_key(ref):
+    """Return a hashable identity for an SDK reference"""
+    return ref.value if isinstance(ref, c_void_p) else ref
+
+
+class PropertyCache:
+    """
+    Cache of property values keyed by (camera_ref, property_id)
+    
+    CanonCamera only stores properties that never change during a session
+    (see STATIC_PROPERTIES), so entries stay valid without event dispatch.
+    The property event handler still drops an entry if the camera reports
+    a change.
+    """
+    __slots__ = ('data',)
+    
+    def __init__(self):
+        self.data = {}
+    
+    def get(self, camera_ref, property_id):
+        return self.data.get((_ref_key(camera_ref), property_id), _MISSING)
+    
+    def put(self, camera_ref, property_id, value):
+        self.data[(_ref_key(camera_ref), property_id)] = value
+    
+    def invalidate(self, camera_ref, property_id):
+        self.data.pop((_ref_key(camera_ref), property_id), None)
+    
+    def clear(self):
+        self.data.clear()
+
+
+def get_property_uint32(camera_ref, property_id, param=0, cache=None):
+    """Helper to get a UInt32 property, optionally through a PropertyCache"""
+    use_cache = cache is not None and param == 0
+    if use_cache:
+        cached = cache.get(camera_ref, property_id)
+        if cached is not _MISSING:
+            return cached
+    
     value = EdsUInt32()
     err = EdsGetPropertyData(camera_ref, property_id, param, sizeof(value), byref(value))
     check_error(err, "EdsGetPropertyData")
+    
+    if use_cache:
+        cache.put(camera_ref, property_id, value.value)
     return value.value
 
 
-def get_property_string(camera_ref, property_id, param=0, max_len=256):
-    """Helper to get a string property"""
+def get_property_string(camera_ref, property_id, param=0, max_len=256, cache=None):
+    """Helper to get a string property, optionally through a PropertyCache"""
+    use_cache = cache is not None and param == 0
+    if use_cache:
+        cached = cache.get(camera_ref, property_id)
+        if cached is not _MISSING:
+            return cached
+    
     buffer = create_string_buffer(max_len)
     err = EdsGetPropertyData(camera_ref, property_id, param, max_len, buffer)
     check_error(err, "EdsGetPropertyData")
-    return buffer.value.decode('utf-8', errors='ignore')
+    result = buffer.value.decode('utf-8', errors='ignore')
+    
+    if use_cache:
+        cache.put(camera_ref, property_id, result)
+    return result
 
 
 def set_property_uint32(camera_ref, property_id, value, param=0):
@@ -572,6 +631,414 @@ def set_property_uint32(camera_ref, property_id, value, param=0):
     check_error(err, "EdsSetPropertyData")
 
 
+class Ref:
+    """
+    Context manager holding an extra SDK reference for the duration of a block
+    
+    Only needed when a reference must outlive the frame that obtained it
+    (e.g. it is handed to another thread). References returned by
+    EdsGetCameraList/EdsGetChildAtIndex are already valid for synchronous
+    calls made by their owner, so the property helpers never retain.
+    """
+    __slots__ = ('ref',)
+    
+    def __init__(self, ref):
+        self.ref = ref
+    
+    def __enter__(self):
+        EdsRetain(self.ref)
+        return self.ref
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        EdsRelease(self.ref)
+        return False
+
+
+# =============================================================================
+# Precomputed Command Arguments
+# =============================================================================
+
+# Plain ints so hot paths skip IntEnum lookups on every call
+_FILE_CREATE_ALWAYS = int(EdsFileCreateDisposition.CreateAlways)
+_ACCESS_WRITE = int(EdsAccess.Write)
+
+# os.open flags for the empty file the SDK needs before it will write
+_STUB_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# (command, parameter) pairs for EdsSendCommand
+_CMD_TAKE_PICTURE = (int(EdsCameraCommand.TakePicture), 0)
+_CMD_EXTEND_SHUTDOWN_TIMER = (int(EdsCameraCommand.ExtendShutDownTimer), 0)
+_CMD_BULB_START = (int(EdsCameraCommand.BulbStart), 0)
+_CMD_BULB_END = (int(EdsCameraCommand.BulbEnd), 0)
+_CMD_EVF_AF = (int(EdsCameraCommand.DoEvfAf), 0)
+_CMD_SHUTTER_HALFWAY = (int(EdsCameraCommand.PressShutterButton), int(EdsShutterButton.Halfway))
+_CMD_SHUTTER_COMPLETELY = (int(EdsCameraCommand.PressShutterButton), int(EdsShutterButton.Completely))
+_CMD_SHUTTER_OFF = (int(EdsCameraCommand.PressShutterButton), int(EdsShutterButton.OFF))
+_DRIVE_LENS_EVF = int(EdsCameraCommand.DriveLensEvf)
+_DRIVE_LENS_FAR = 0x8000
+
+
+def send_command(camera_ref, command, func_name):
+    """Helper to send a precomputed (command, parameter) pair"""
+    err = EdsSendCommand(camera_ref, *command)
+    check_error(err, func_name)
+
+
+# Normalized camera event delivered by the event handlers
+# kind: 'object', 'property' or 'state'; event: SDK event ID; param: event parameter
+CameraEvent = namedtuple('CameraEvent', ['kind', 'event', 'param'])
+
+# Directory item copied out of EdsDirectoryItemInfo by _enumerate_children()
+_DirEntry = namedtuple('_DirEntry', ['item_ref', 'filename', 'size', 'is_folder'])
+
+def _write_all(fd, data):
+    """Write all of data to fd, retrying short writes"""
+    written = 0
+    while written < len(data):
+        written += os.write(fd, data[written:])
+
+
+def _backoff_delay(attempt, base, cap):
+    """Exponential backoff with equal jitter: half fixed, half random"""
+    delay = min(cap, base * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _folder_number(name):
+    """Leading DCF folder number of a name like '101CANON' (-1 if none)"""
+    digits = name[:3]
+    return int(digits) if digits.isdigit() else -1
+
+
+# Per-thread count/info buffers reused by every directory listing
+_listing_scratch = threading.local()
+
+
+def _get_listing_scratch():
+    """Return this thread's (EdsUInt32, EdsDirectoryItemInfo) scratch pair"""
+    scratch = getattr(_listing_scratch, 'buffers', None)
+    if scratch is None:
+        scratch = _listing_scratch.buffers = (EdsUInt32(), EdsDirectoryItemInfo())
+    return scratch
+
+
+# =============================================================================
+# Live View Streaming
+# =============================================================================
+
+class LiveViewSession:
+    """
+    Holds one memory stream and EVF image reference across Live View frames
+    
+    The references are created once on enter and released on exit, so
+    each grab() only downloads and copies the frame.
+    
+    Example:
+        with camera.live_view_session() as session:
+            for _ in range(100):
+                frame = session.grab()
+    """
+    
+    def __init__(self, camera_ref, initial_size=0, sdk_lock=None):
+        """
+        Args:
+            camera_ref: EdsCameraRef with an open session and EVF output to PC
+            initial_size: Bytes to preallocate for the memory stream
+            sdk_lock: Lock held around every SDK call (the camera's _sdk_lock)
+        """
+        self.camera_ref = camera_ref
+        self.initial_size = initial_size
+        self._sdk_lock = sdk_lock if sdk_lock is not None else threading.RLock()
+        self.stream = None
+        self.evf_image = None
+    
+    def open(self):
+        """Create the memory stream and EVF image reference"""
+        with self._sdk_lock:
+            stream = EdsStreamRef()
+            err = EdsCreateMemoryStream(self.initial_size, byref(stream))
+            check_error(err, "EdsCreateMemoryStream")
+            
+            evf_image = EdsEvfImageRef()
+            err = EdsCreateEvfImageRef(stream, byref(evf_image))
+            if err != EdsErrorCodes.EDS_ERR_OK:
+                EdsRelease(stream)
+                check_error(err, "EdsCreateEvfImageRef")
+        
+        self.stream = stream
+        self.evf_image = evf_image
+    
+    def close(self):
+        """Release the memory stream and EVF image reference"""
+        with self._sdk_lock:
+            if self.evf_image is not None:
+                EdsRelease(self.evf_image)
+                self.evf_image = None
+            if self.stream is not None:
+                EdsRelease(self.stream)
+                self.stream = None
+    
+    def grab(self):
+        """
+        Download the current Live View frame
+        
+        Returns:
+            bytes: JPEG image data, or None if the frame is not available
+        """
+        with self._sdk_lock:
+            err = EdsDownloadEvfImage(self.camera_ref, self.evf_image)
+            if err != EdsErrorCodes.EDS_ERR_OK:
+                return None
+            
+            try:
+                # Position (not length) marks the end of this frame in a reused stream
+                length = EdsUInt64()
+                data_ptr = c_void_p()
+                if (EdsGetPosition(self.stream, byref(length)) != EdsErrorCodes.EDS_ERR_OK or
+                        EdsGetPointer(self.stream, byref(data_ptr)) != EdsErrorCodes.EDS_ERR_OK or
+                        not data_ptr.value or not length.value):
+                    return None
+                
+                return string_at(data_ptr.value, length.value)
+            finally:
+                # Rewind so the next frame overwrites this one
+                EdsSeek(self.stream, 0, EdsSeekOrigin.Begin)
+    
+    def __enter__(self):
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class LiveViewStreamer:
+    """
+    Downloads Live View (EVF) frames on a background thread
+    
+    Two LiveViewSessions are filled alternately, so a frame can be copied
+    out of one buffer while the camera writes the next one into the other.
+    Only the newest frame is kept; consumers that fall behind simply skip
+    stale frames.
+    """
+    
+    BUFFER_COUNT = 2
+    INITIAL_STREAM_SIZE = 2_000_000
+    
+    def __init__(self, camera_ref, interval=0.0, sdk_lock=None):
+        """
+        Args:
+            camera_ref: EdsCameraRef with an open session and EVF output to PC
+            interval: Minimum delay between frame downloads in seconds
+            sdk_lock: Lock held around every SDK call (the camera's _sdk_lock)
+        """
+        self.camera_ref = camera_ref
+        self.interval = interval
+        self._sdk_lock = sdk_lock if sdk_lock is not None else threading.RLock()
+        self._sessions = []
+        self._frames = queue.Queue(maxsize=1)
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._camera_hold = None
+    
+    def start(self):
+        """Allocate the EVF buffers and start the download thread"""
+        if self._thread is not None:
+            return
+        
+        try:
+            for _ in range(self.BUFFER_COUNT):
+                session = LiveViewSession(self.camera_ref, self.INITIAL_STREAM_SIZE,
+                                          self._sdk_lock)
+                session.open()
+                self._sessions.append(session)
+        except RuntimeError:
+            self._release_buffers()
+            raise
+        
+        # The worker thread uses the camera after this call returns
+        self._camera_hold = Ref(self.camera_ref)
+        self._camera_hold.__enter__()
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="LiveViewStreamer", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop the download thread and release the EVF buffers"""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        self._release_buffers()
+        if self._camera_hold is not None:
+            self._camera_hold.__exit__(None, None, None)
+            self._camera_hold = None
+    
+    def get_frame(self, timeout=None):
+        """
+        Get the newest Live View frame
+        
+        Args:
+            timeout: Seconds to wait for a frame (None returns immediately)
+        
+        Returns:
+            bytes: JPEG image data, or None if no new frame is available
+        """
+        try:
+            if timeout is None:
+                return self._frames.get_nowait()
+            return self._frames.get(timeout=timeout)
+        except queue.Empty:
+            return None
+    
+    def _release_buffers(self):
+        for session in self._sessions:
+            session.close()
+        self._sessions = []
+    
+    def _publish(self, frame):
+        """Replace any unconsumed frame with the newest one"""
+        try:
+            self._frames.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._frames.put_nowait(frame)
+        except queue.Full:
+            pass
+    
+    def _run(self):
+        _init_sdk_thread()
+        index = 0
+        while not self._stop_event.is_set():
+            frame = self._sessions[index].grab()
+            if frame is None:
+                # EVF not ready yet (or transient error) - back off briefly
+                self._stop_event.wait(0.05)
+                continue
+            
+            self._publish(frame)
+            index = (index + 1) % self.BUFFER_COUNT
+            
+            if self.interval:
+                self._stop_event.wait(self.interval)
+
+
+# =============================================================================
+# Background Download
+# =============================================================================
+
+class BackgroundDownloader:
+    """
+    Downloads new images from the camera card while capture continues
+    
+    The camera's object event handler hands every DirItemCreated item to
+    submit(), and a few worker threads download them. Nothing walks the
+    card, so capture is never held up by a directory scan, and files that
+    were already on the card when start() was called are never downloaded.
+    Events are only delivered while the capture thread dispatches them
+    (process_events() and the wait helpers); stop() dispatches once more to
+    pick up the last shots.
+    """
+    
+    def __init__(self, camera, save_directory, max_workers=2, callback=None):
+        """
+        Args:
+            camera: CanonCamera with an open session
+            save_directory: Directory to save images to
+            max_workers: Number of download threads (2-4 recommended)
+            callback: Optional callback(filename, save_path) per downloaded file
+        """
+        self.camera = camera
+        self.save_directory = save_directory
+        self.max_workers = max(1, max_workers)
+        self.callback = callback
+        self.downloaded_files = []
+        # Unbounded: submit() runs on the SDK callback thread and must not block
+        self._queue = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """Start the download threads"""
+        if self._workers:
+            return
+        
+        os.makedirs(self.save_directory, exist_ok=True)
+        
+        for i in range(self.max_workers):
+            worker = threading.Thread(target=self._download_worker,
+                                      name=f"BackgroundDownload-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+    
+    def submit(self, item_ref):
+        """
+        Queue a newly created directory item for download
+        
+        Args:
+            item_ref: EdsDirectoryItemRef from a DirItemCreated event
+        
+        Returns:
+            True if the item was queued (the downloader then releases it);
+            False for folders and unreadable items, which the caller keeps
+        """
+        item_info = self.camera._get_dir_item_info(item_ref)
+        if item_info is None or item_info[2]:
+            return False
+        size, filename, _ = item_info
+        with self._lock:
+            if not self._workers:
+                return False
+            self._queue.put(_DirEntry(item_ref, filename, size, False))
+        return True
+    
+    def stop(self):
+        """
+        Dispatch pending events, wait for queued downloads and stop the threads
+        
+        Must be called on the thread that dispatches SDK events.
+        
+        Returns:
+            list: Paths of all files downloaded since start()
+        """
+        if self._workers:
+            # Deliver DirItemCreated events for the last shots
+            self.camera.process_events(0.5, min_idle_ms=200)
+            
+            with self._lock:
+                workers = self._workers
+                self._workers = []
+                for _ in workers:
+                    self._queue.put(None)
+            for worker in workers:
+                worker.join()
+        
+        return list(self.downloaded_files)
+    
+    def _download_worker(self):
+        _init_sdk_thread()
+        prefix = os.path.join(self.save_directory, '')
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            save_path = prefix + entry.filename
+            try:
+                if self.camera._download_to_path(entry.item_ref, entry.size, save_path):
+                    with self._lock:
+                        self.downloaded_files.append(save_path)
+                    if self.callback:
+                        self.callback(entry.filename, save_path)
+            except Exception as e:
+                logger.error("Background download error: %s", e)
+            finally:
+                with self.camera._sdk_lock:
+                    EdsRelease(entry.item_ref)
+
+
 # =============================================================================
 # High-Level Wrapper Class
 # =============================================================================
@@ -579,12 +1046,95 @@ def set_property_uint32(camera_ref, property_id, value, param=0):
 class CanonCamera:
     """High-level wrapper class for Canon camera operations"""
     
+    # Live View stream/EVF image pairs kept for reuse by get_live_view_image()
+    EVF_POOL_SIZE = 2
+    
+    # Seconds a volume scan is reused by count/download calls
+    DIR_CACHE_TTL = 2.0
+    
+    # Minimum seconds between ExtendShutDownTimer commands from keep_alive()
+    # (bodies typically allow ~60 s before auto power off)
+    KEEP_ALIVE_INTERVAL = 30.0
+    
+    # Bytes per EdsDownload call on the memory stream path; each block is
+    # written to disk while the next one transfers
+    DOWNLOAD_BLOCK_SIZE = 4 * 1024 * 1024
+    
+    # Properties fixed for the life of a session; only these are cached.
+    # Battery, shot count and exposure settings are always read from the
+    # camera, since property events are only seen while events are pumped.
+    STATIC_PROPERTIES = frozenset((
+        EdsPropertyID_.ProductName,
+        EdsPropertyID_.FirmwareVersion,
+    ))
+    
+    # (property_id, as_string) read into the property cache by open_session()
+    PREFETCH_PROPERTIES = (
+        (EdsPropertyID_.ProductName, True),
+        (EdsPropertyID_.FirmwareVersion, True),
+    )
+    
+    # Whether EdsCreateFileStreamEx needs the target file to exist first.
+    # None until the first download probes it (see _create_file_stream)
+    _needs_presence_touch = None
+    
     def __init__(self):
         self.camera_ref = None
         self.camera_list = None
-        self._object_event_handler = None
-        self._property_event_handler = None
-        self._state_event_handler = None
+        # SDK callback thunks are created once and re-registered as needed
+        self._object_event_handler = EdsObjectEventHandler(self._object_event_callback)
+        self._property_event_handler = EdsPropertyEventHandler(self._on_property_event)
+        self._state_event_handler = EdsStateEventHandler(self._on_state_event)
+        
+        # Download settings read by _object_event_callback
+        self._save_directory = None
+        self._download_callback = None
+        
+        self._property_cache = PropertyCache()
+        self._device_info_cache = None
+        self._dir_cache = None
+        self._live_view_streamer = None
+        self._evf_pool_enabled = True
+        self._evf_stream_pool = []
+        self._event_queue = queue.Queue(maxsize=256)
+        self._event_pump_thread = None
+        self._event_pump_stop = threading.Event()
+        
+        # Serializes SDK calls on this session. Download workers, the volume
+        # walk and event dispatch run on different threads and the SDK is
+        # not reentrant; only the disk writes overlap. Reentrant because
+        # event callbacks run inside EdsGetEvent()/DispatchMessage().
+        self._sdk_lock = threading.RLock()
+        
+        # Reusable ctypes structs for hot paths (object events fire per image),
+        # guarded by _sdk_lock like the SDK calls that fill them
+        self._reusable_dir_info = EdsDirectoryItemInfo()
+        self._reusable_capacity = EdsCapacity()
+        
+        # Worker pool used by setup_download_handler (created on demand)
+        self._download_pool = None
+        
+        # Single thread writing downloaded blocks to disk for every
+        # transfer on the session (created on demand)
+        self._write_pool = None
+        
+        # User download callbacks run on their own thread so a slow
+        # callback never holds up a download worker
+        self._callback_queue = queue.Queue()
+        self._callback_thread = None
+        
+        # Set by the download handler once every file of the current shot
+        # has been saved. Downloads are tagged with the shot they belong
+        # to, so a late file from an earlier shot doesn't count.
+        self._download_done = threading.Event()
+        self._shot_lock = threading.Lock()
+        self._shot_id = 0
+        self._shot_files_pending = 0
+        
+        self._background_downloader = None
+        # Files download_images_from_camera() found already saved locally
+        self.last_skipped_count = 0
+        self._last_extend_ts = float('-inf')
         
     def initialize_sdk(self):
         """Initialize the Canon SDK"""
@@ -595,6 +1145,7 @@ class CanonCamera:
         """Terminate the Canon SDK"""
         if self.camera_ref:
             self.close_session()
+        self._drain_evf_pool()
         if self.camera_list:
             EdsRelease(self.camera_list)
             self.camera_list = None
@@ -624,6 +1175,7 @@ class CanonCamera:
         err = EdsGetChildAtIndex(self.camera_list, index, byref(camera))
         check_error(err, "EdsGetChildAtIndex")
         self.camera_ref = camera
+        self._device_info_cache = None
         
         return camera
     
@@ -632,60 +1184,252 @@ class CanonCamera:
         if not self.camera_ref:
             raise RuntimeError("No camera selected. Call get_camera() first.")
         
-        device_info = EdsDeviceInfo()
-        err = EdsGetDeviceInfo(self.camera_ref, byref(device_info))
-        check_error(err, "EdsGetDeviceInfo")
+        # Device info does not change while the camera is selected
+        if self._device_info_cache is None:
+            device_info = EdsDeviceInfo()
+            with self._sdk_lock:
+                err = EdsGetDeviceInfo(self.camera_ref, byref(device_info))
+            check_error(err, "EdsGetDeviceInfo")
+            
+            self._device_info_cache = {
+                'port': _decode_sdk_string(device_info.szPortName),
+                'description': _decode_sdk_string(device_info.szDeviceDescription),
+                'subtype': device_info.deviceSubType
+            }
         
-        return {
-            'port': device_info.szPortName.decode('utf-8', errors='ignore'),
-            'description': device_info.szDeviceDescription.decode('utf-8', errors='ignore'),
-            'subtype': device_info.deviceSubType
-        }
+        # Return a copy so callers can extend it (see get_camera_info)
+        return dict(self._device_info_cache)
     
-    def open_session(self):
-        """Open a session with the camera"""
+    def open_session(self, event_pump_interval=None):
+        """
+        Open a session with the camera
+        
+        By default events are dispatched by process_events() and the wait
+        helpers on the calling thread, which is where the SDK posts its
+        window messages on Windows.
+        
+        Args:
+            event_pump_interval: Interval in seconds for a background
+                                 EdsGetEvent() pump (see start_event_pump),
+                                 or None (default) to dispatch events on
+                                 the calling thread
+        """
         if not self.camera_ref:
             raise RuntimeError("No camera selected. Call get_camera() first.")
         
         err = EdsOpenSession(self.camera_ref)
         check_error(err, "EdsOpenSession")
+        
+        self._register_event_handlers()
+        self._prefetch_properties()
+        
+        if event_pump_interval is not None:
+            self.start_event_pump(event_pump_interval)
     
-    def close_session(self):
-        """Close the session with the camera"""
-        if self.camera_ref:
+    def _register_event_handlers(self):
+        """Register object, property and state handlers that feed the event queue"""
+        err = EdsSetObjectEventHandler(
+            self.camera_ref,
+            EdsObjectEvent.All,
+            self._object_event_handler,
+            None
+        )
+        check_error(err, "EdsSetObjectEventHandler")
+        
+        err = EdsSetPropertyEventHandler(
+            self.camera_ref,
+            EdsPropertyEvent.All,
+            self._property_event_handler,
+            None
+        )
+        check_error(err, "EdsSetPropertyEventHandler")
+        
+        err = EdsSetCameraStateEventHandler(
+            self.camera_ref,
+            EdsStateEvent.All,
+            self._state_event_handler,
+            None
+        )
+        check_error(err, "EdsSetCameraStateEventHandler")
+    
+    def _prefetch_properties(self):
+        """
+        Read PREFETCH_PROPERTIES into the property cache
+        
+        get_camera_info() and the name/firmware getters are served from the
+        cache afterwards. Properties the body doesn't support are skipped.
+        """
+        for property_id, as_string in self.PREFETCH_PROPERTIES:
             try:
-                err = EdsCloseSession(self.camera_ref)
-                # Only check error if it's not already released/shutdown
-                if err != EdsErrorCodes.EDS_ERR_OK:
-                    # Ignore errors if camera already shut down
-                    pass
-            except OSError:
-                # Handle access violations from already-closed sessions
+                self.get_property(property_id, as_string=as_string)
+            except (RuntimeError, OSError):
+                pass
+    
+    def _discard_object_events(self):
+        """Drop queued object events, keeping property and state events in order"""
+        kept = []
+        while True:
+            try:
+                camera_event = self._event_queue.get_nowait()
+            except queue.Empty:
+                break
+            if camera_event.kind != 'object':
+                kept.append(camera_event)
+        for camera_event in kept:
+            self._post_event(camera_event.kind, camera_event.event, camera_event.param)
+    
+    def _post_event(self, kind, event, param):
+        """Queue a normalized event, discarding the oldest one if nobody is consuming"""
+        camera_event = CameraEvent(kind, event, param)
+        try:
+            self._event_queue.put_nowait(camera_event)
+        except queue.Full:
+            try:
+                self._event_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._event_queue.put_nowait(camera_event)
+            except queue.Full:
                 pass
-            finally:
-                try:
-                    EdsRelease(self.camera_ref)
-                except:
-                    pass
-                self.camera_ref = None
     
-    def take_picture(self, retries=3, retry_delay=1.0):
+    def _object_event_callback(self, event, obj_ref, context):
+        """
+        Object event callback - queues the event and, once
+        setup_download_handler() has been called, hands transfer
+        requests to the download pool
+        """
+        try:
+            self._post_event('object', event, 0)
+            
+            # New files on the card go to the background downloader
+            downloader = self._background_downloader
+            if (event == EdsObjectEvent.DirItemCreated and obj_ref
+                    and downloader is not None and downloader.submit(obj_ref)):
+                return EdsErrorCodes.EDS_ERR_OK
+            
+            save_directory = self._save_directory
+            pool = self._download_pool
+            if (event == EdsObjectEvent.DirItemRequestTransfer and obj_ref
+                    and save_directory is not None and pool is not None):
+                # Get file info
+                item_info = self._get_dir_item_info(obj_ref)
+                
+                if item_info is not None:
+                    filename = item_info[1]
+                    save_path = os.path.join(save_directory, filename)
+                    
+                    # Hand the download off so the callback thread returns;
+                    # the worker releases obj_ref from here on
+                    pool.submit(self._download_item, obj_ref, filename, save_path, self._shot_id)
+                    return EdsErrorCodes.EDS_ERR_OK
+                    
+        except Exception as e:
+            logger.error("Handler error: %s", e)
+        
+        # Always release object reference unless a worker took it
+        if obj_ref:
+            try:
+                with self._sdk_lock:
+                    EdsRelease(obj_ref)
+            except (RuntimeError, OSError):
+                pass
+        
+        return EdsErrorCodes.EDS_ERR_OK
+    
+    def _on_property_event(self, event, property_id, param, context):
+        """Property event callback - invalidates the cached value"""
+        if event == EdsPropertyEvent.PropertyChanged:
+            self._property_cache.invalidate(self.camera_ref, property_id)
+        self._post_event('property', event, property_id)
+        return EdsErrorCodes.EDS_ERR_OK
+    
+    def _on_state_event(self, event, param, context):
+        """State event callback"""
+        self._post_event('state', event, param)
+        return EdsErrorCodes.EDS_ERR_OK
+    
+    def close_session(self):
+        """Close the session with the camera"""
+        self.stop_live_view_stream()
+        self.stop_event_pump()
+        self.stop_background_download()
+        # Transfer requests after this are released, not downloaded, until
+        # setup_download_handler() is called again
+        self._save_directory = None
+        self._download_callback = None
+        self._shutdown_download_pool()
+        self._shutdown_write_pool()
+        self._stop_callback_worker()
+        self._drain_evf_pool()
+        self._invalidate_dir_cache()
+        self._property_cache.clear()
+        self._device_info_cache = None
+        
+        if not self.camera_ref:
+            return
+        
+        camera_ref = self.camera_ref
+        self.camera_ref = None
+        
+        # Error codes are ignored - the camera may already have shut down
+        try:
+            EdsCloseSession(camera_ref)
+        except OSError:
+            # Handle access violations from already-closed sessions
+            pass
+        
+        try:
+            EdsRelease(camera_ref)
+        except (OSError, RuntimeError):
+            pass
+        
+        if _open_refs:
+            logger.warning("%d SDK item refs still open at session close", len(_open_refs))
+    
+    def _send_command(self, command, func_name):
+        """Send a precomputed (command, parameter) pair under the SDK lock"""
+        with self._sdk_lock:
+            send_command(self.camera_ref, command, func_name)
+    
+    def take_picture(self, retries=3, retry_delay=1.0, max_retry_delay=5.0,
+                     wait=False, timeout=10.0):
         """
         Take a picture with automatic retry on common errors
         
+        Retries use exponential backoff with equal jitter, so every retry
+        waits at least half of its backoff before trying again.
+        
         Args:
             retries: Number of retry attempts for recoverable errors
-            retry_delay: Delay between retries in seconds
+            retry_delay: Base delay between retries in seconds
+            max_retry_delay: Upper bound for a single backoff in seconds
+            wait: Block until the download handler has saved every file of
+                  the shot, e.g. both files for RAW+JPEG (requires
+                  setup_download_handler() and SaveTo Host/Both)
+            timeout: Maximum time to wait for the downloads in seconds
+        
+        Returns:
+            With wait=True, True if all downloads finished within timeout;
+            otherwise None
         """
         if not self.camera_ref:
             raise RuntimeError("No camera selected and session not opened.")
         
-        import time
+        files_expected = self.files_per_shot() if wait else 1
         
         for attempt in range(retries + 1):
             try:
-                err = EdsSendCommand(self.camera_ref, EdsCameraCommand.TakePicture, 0)
-                check_error(err, "EdsSendCommand(TakePicture)")
+                # Object events still queued belong to earlier shots
+                self._discard_object_events()
+                with self._shot_lock:
+                    self._shot_id += 1
+                    self._shot_files_pending = files_expected
+                    self._download_done.clear()
+                self._send_command(_CMD_TAKE_PICTURE, "EdsSendCommand(TakePicture)")
+                self._invalidate_dir_cache()
+                if wait:
+                    return self._wait_for_download(timeout)
                 return  # Success!
                 
             except RuntimeError as e:
@@ -693,34 +1437,56 @@ class CanonCamera:
                 
                 # Check for recoverable errors
                 if "DEVICE_BUSY" in error_str and attempt < retries:
-                    print(f"   Camera busy, retrying in {retry_delay}s... (attempt {attempt+1}/{retries})")
-                    time.sleep(retry_delay)
+                    delay = _backoff_delay(attempt, retry_delay, max_retry_delay)
+                    logger.debug("Camera busy, retrying in %.2fs... (attempt %d/%d)",
+                                 delay, attempt + 1, retries)
+                    time.sleep(delay)
                     continue
                     
                 elif "AF_NG" in error_str and attempt < retries:
-                    print(f"   Autofocus failed, retrying in {retry_delay}s... (attempt {attempt+1}/{retries})")
-                    time.sleep(retry_delay)
+                    delay = _backoff_delay(attempt, retry_delay, max_retry_delay)
+                    logger.debug("Autofocus failed, retrying in %.2fs... (attempt %d/%d)",
+                                 delay, attempt + 1, retries)
+                    time.sleep(delay)
                     continue
                 
                 # Non-recoverable or out of retries
                 raise
     
+    def _wait_for_download(self, timeout):
+        """Wait for _download_done, dispatching events if no pump is running"""
+        if self._event_pump_thread is not None:
+            return self._download_done.wait(timeout)
+        
+        deadline = time.monotonic() + timeout
+        while not self._download_done.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self.process_events(min(remaining, 0.05))
+        return True
+    
     def get_property(self, property_id, as_string=False):
         """Get a camera property"""
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
-        if as_string:
-            return get_property_string(self.camera_ref, property_id)
-        else:
-            return get_property_uint32(self.camera_ref, property_id)
+        cache = self._property_cache if property_id in self.STATIC_PROPERTIES else None
+        with self._sdk_lock:
+            if as_string:
+                return get_property_string(self.camera_ref, property_id, cache=cache)
+            else:
+                return get_property_uint32(self.camera_ref, property_id, cache=cache)
     
     def set_property(self, property_id, value):
         """Set a camera property"""
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
-        set_property_uint32(self.camera_ref, property_id, value)
+        # Camera may round or reject the value, so re-read on next get
+        self._property_cache.invalidate(self.camera_ref, property_id)
+        with self._sdk_lock:
+            set_property_uint32(self.camera_ref, property_id, value)
     
     def set_save_to(self, destination):
         """Set where to save captured images (Camera, Host, or Both)"""
@@ -731,130 +1497,344 @@ class CanonCamera:
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
-        capacity = EdsCapacity()
-        capacity.numberOfFreeClusters = free_clusters
-        capacity.bytesPerSector = bytes_per_sector
-        capacity.reset = 1 if reset else 0
-        
-        err = EdsSetCapacity(self.camera_ref, capacity)
+        with self._sdk_lock:
+            capacity = self._reusable_capacity
+            capacity.numberOfFreeClusters = free_clusters
+            capacity.bytesPerSector = bytes_per_sector
+            capacity.reset = 1 if reset else 0
+            
+            err = EdsSetCapacity(self.camera_ref, capacity)
         check_error(err, "EdsSetCapacity")
     
     # =============================================================================
     # Download Helper Methods
     # =============================================================================
     
-    def download_file(self, directory_item_ref, save_path):
+    def _get_dir_item_info(self, directory_item_ref):
+        """
+        Read size, filename and folder flag of a directory item using the
+        shared struct
+        
+        Args:
+            directory_item_ref: EdsDirectoryItemRef to query
+            
+        Returns:
+            Tuple of (size, filename, is_folder), or None if the SDK call failed
+        """
+        with self._sdk_lock:
+            info = self._reusable_dir_info
+            memset(byref(info), 0, sizeof(info))
+            err = EdsGetDirectoryItemInfo(directory_item_ref, byref(info))
+            if err != EdsErrorCodes.EDS_ERR_OK:
+                return None
+            return info.size, _decode_sdk_string(info.szFileName), bool(info.isFolder)
+    
+    def download_file(self, directory_item_ref, save_path, download_buffer_size=None,
+                      use_memory_stream=True):
         """
         Download a file from camera to specified path
         
         Args:
             directory_item_ref: EdsDirectoryItemRef from download event
             save_path: Full path where file should be saved
+            download_buffer_size: Bytes transferred per EdsDownload call
+                                  (default: DOWNLOAD_BLOCK_SIZE for memory
+                                  streams, whole file for file streams)
+            use_memory_stream: Download into memory and write the file
+                               directly (False uses an SDK file stream)
             
         Returns:
             True if successful, False otherwise
         """
-        import os
-        
         try:
             # Get file info
-            info = EdsDirectoryItemInfo()
-            err = EdsGetDirectoryItemInfo(directory_item_ref, byref(info))
-            if err != EdsErrorCodes.EDS_ERR_OK:
+            item_info = self._get_dir_item_info(directory_item_ref)
+            if item_info is None:
                 return False
+            size = item_info[0]
             
             # Ensure absolute path
             save_path = os.path.abspath(save_path)
             
             # Create directory if it doesn't exist
             directory = os.path.dirname(save_path)
-            if directory and not os.path.exists(directory):
+            if directory:
                 os.makedirs(directory, exist_ok=True)
             
-            # CRITICAL: Create empty file first - SDK requires file to exist!
-            with open(save_path, 'wb') as f:
-                pass  # Create empty file
+            return self._download_to_path(directory_item_ref, size, save_path,
+                                          download_buffer_size, use_memory_stream)
             
-            # Create file stream
-            stream = EdsStreamRef()
-            err = EdsCreateFileStream(
-                save_path.encode('utf-8'),
-                EdsFileCreateDisposition.CreateAlways,
-                EdsAccess.Write,
-                byref(stream)
-            )
+        except Exception as e:
+            logger.error("Download error: %s", e)
+            return False
+    
+    def _create_file_stream(self, save_path):
+        """
+        Open an SDK file stream for writing save_path
+        
+        Some SDK builds only open files that already exist. The first call
+        tries without creating the file; if that fails it touches the file,
+        retries, and remembers the outcome for all later downloads.
+        
+        Args:
+            save_path: Destination path
             
+        Returns:
+            EdsStreamRef, or None if the stream could not be created
+        
+        Raises:
+            OSError: If the placeholder file cannot be created
+        """
+        needs_touch = CanonCamera._needs_presence_touch
+        if needs_touch:
+            os.close(os.open(save_path, _STUB_FILE_FLAGS, 0o644))
+        
+        # Wide-char variant takes the path as-is
+        stream = EdsStreamRef()
+        err = EdsCreateFileStreamEx(save_path, _FILE_CREATE_ALWAYS, _ACCESS_WRITE, byref(stream))
+        
+        if needs_touch is None:
+            if err == EdsErrorCodes.EDS_ERR_OK:
+                CanonCamera._needs_presence_touch = False
+            else:
+                os.close(os.open(save_path, _STUB_FILE_FLAGS, 0o644))
+                err = EdsCreateFileStreamEx(save_path, _FILE_CREATE_ALWAYS, _ACCESS_WRITE, byref(stream))
+                if err == EdsErrorCodes.EDS_ERR_OK:
+                    CanonCamera._needs_presence_touch = True
+        
+        return stream if err == EdsErrorCodes.EDS_ERR_OK else None
+    
+    def _download_to_path(self, directory_item_ref, size, save_path, download_buffer_size=None,
+                          use_memory_stream=True):
+        """
+        Transfer a directory item of known size into save_path
+        
+        With use_memory_stream the file is downloaded into an SDK memory
+        stream and each block is written straight from SDK memory with
+        os.write() while the next block transfers, which skips the SDK's
+        synchronous file writer. The file stream path is used
+        otherwise, or if the memory stream cannot be allocated.
+        
+        Args:
+            directory_item_ref: EdsDirectoryItemRef to download
+            size: File size in bytes
+            save_path: Destination path (its directory must exist)
+            download_buffer_size: Bytes transferred per EdsDownload call
+            use_memory_stream: Download via memory instead of a file stream
+            
+        Returns:
+            True if successful, False otherwise
+        
+        Raises:
+            OSError: If the destination file cannot be created or written
+        """
+        sdk_lock = self._sdk_lock
+        stream = None
+        if use_memory_stream:
+            stream = EdsStreamRef()
+            with sdk_lock:
+                err = EdsCreateMemoryStream(size, byref(stream))
             if err != EdsErrorCodes.EDS_ERR_OK:
+                # Fall back to the file stream, e.g. when memory is short
+                stream = None
+                use_memory_stream = False
+        
+        if stream is None:
+            with sdk_lock:
+                stream = self._create_file_stream(save_path)
+            if stream is None:
                 return False
+        
+        try:
+            if use_memory_stream:
+                return self._download_overlapped(directory_item_ref, size, save_path, stream,
+                                                 download_buffer_size or self.DOWNLOAD_BLOCK_SIZE)
             
-            # Download the file
-            err = EdsDownload(directory_item_ref, info.size, stream)
+            # Download the file, in blocks if a buffer size was given
+            block = download_buffer_size or size
+            remaining = size
+            err = EdsErrorCodes.EDS_ERR_OK
+            while err == EdsErrorCodes.EDS_ERR_OK and remaining > 0:
+                chunk = min(block, remaining)
+                with sdk_lock:
+                    err = EdsDownload(directory_item_ref, chunk, stream)
+                remaining -= chunk
             
             if err != EdsErrorCodes.EDS_ERR_OK:
-                EdsRelease(stream)
+                with sdk_lock:
+                    EdsDownloadCancel(directory_item_ref)
                 return False
             
             # Complete download
-            err = EdsDownloadComplete(directory_item_ref)
-            
+            with sdk_lock:
+                err = EdsDownloadComplete(directory_item_ref)
+            return err == EdsErrorCodes.EDS_ERR_OK
+        finally:
             # Release stream
-            EdsRelease(stream)
+            with sdk_lock:
+                EdsRelease(stream)
+    
+    def _download_overlapped(self, directory_item_ref, size, save_path, stream, block):
+        """
+        Download into a memory stream while finished blocks are written out
+        
+        Each block is handed to the session's writer thread as soon as
+        EdsDownload() returns, so writing one block to disk overlaps the USB
+        transfer of the next. The stream is allocated at the full file size,
+        so blocks already downloaded never move while they are being
+        written. If a transfer or write fails the SDK transfer is cancelled.
+        
+        Args:
+            directory_item_ref: EdsDirectoryItemRef to download
+            size: File size in bytes
+            save_path: Destination path
+            stream: Memory stream created with capacity for size bytes
+            block: Bytes transferred per EdsDownload call
             
-            return err == EdsErrorCodes.EDS_ERR_OK
+        Returns:
+            True if successful, False otherwise
+        
+        Raises:
+            OSError: If the destination file cannot be created or written
+        """
+        ok = EdsErrorCodes.EDS_ERR_OK
+        sdk_lock = self._sdk_lock
+        writer = self._get_write_pool()
+        data_ptr = c_void_p()
+        pending = []
+        completing = False
+        fd = os.open(save_path, _STUB_FILE_FLAGS, 0o644)
+        try:
+            offset = 0
+            while offset < size:
+                chunk = min(block, size - offset)
+                with sdk_lock:
+                    if EdsDownload(directory_item_ref, chunk, stream) != ok:
+                        return False
+                    if EdsGetPointer(stream, byref(data_ptr)) != ok or not data_ptr.value:
+                        return False
+                
+                data = memoryview((c_ubyte * chunk).from_address(data_ptr.value + offset))
+                pending.append(writer.submit(_write_all, fd, data.cast('B')))
+                offset += chunk
+            
+            # Surfaces the first write error before the transfer is confirmed
+            for future in pending:
+                future.result()
             
+            completing = True
+            with sdk_lock:
+                return EdsDownloadComplete(directory_item_ref) == ok
+        finally:
+            # Queued writes read from the stream and write to fd; let them
+            # finish before either goes away
+            wait_futures(pending)
+            os.close(fd)
+            if not completing:
+                with sdk_lock:
+                    EdsDownloadCancel(directory_item_ref)
+    
+    def _download_item(self, obj_ref, filename, save_path, shot_id):
+        """Download pool task - downloads one item and queues the user callback"""
+        callback = self._download_callback
+        try:
+            if self.download_file(obj_ref, save_path):
+                with self._shot_lock:
+                    if shot_id == self._shot_id:
+                        self._shot_files_pending -= 1
+                        if self._shot_files_pending <= 0:
+                            self._download_done.set()
+                if callback:
+                    self._callback_queue.put((callback, filename, save_path))
         except Exception as e:
-            print(f"Download error: {e}")
-            return False
+            logger.error("Handler error: %s", e)
+        finally:
+            # Worker owns the object reference once submitted
+            try:
+                with self._sdk_lock:
+                    EdsRelease(obj_ref)
+            except (RuntimeError, OSError):
+                pass
+    
+    def _shutdown_download_pool(self):
+        """Wait for queued downloads to finish and stop the download workers"""
+        if self._download_pool is not None:
+            self._download_pool.shutdown(wait=True)
+            self._download_pool = None
+    
+    def _get_write_pool(self):
+        """Return the session's block writer, starting it on first use"""
+        with self._sdk_lock:
+            if self._write_pool is None:
+                self._write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='edsdk-write')
+            return self._write_pool
+    
+    def _shutdown_write_pool(self):
+        """Finish queued block writes and stop the writer thread"""
+        if self._write_pool is not None:
+            self._write_pool.shutdown(wait=True)
+            self._write_pool = None
+    
+    def _start_callback_worker(self):
+        """Start the thread that runs queued download callbacks"""
+        if self._callback_thread is not None:
+            return
+        
+        def worker():
+            while True:
+                item = self._callback_queue.get()
+                if item is None:
+                    break
+                callback, filename, save_path = item
+                try:
+                    callback(filename, save_path)
+                except Exception as e:
+                    logger.error("Download callback error: %s", e)
+        
+        self._callback_thread = threading.Thread(target=worker, name="EdsDownloadCallbacks", daemon=True)
+        self._callback_thread.start()
     
-    def setup_download_handler(self, callback, save_directory=None):
+    def _stop_callback_worker(self):
+        """Run any pending download callbacks, then stop the callback thread"""
+        if self._callback_thread is not None:
+            self._callback_queue.put(None)
+            self._callback_thread.join()
+            self._callback_thread = None
+    
+    def setup_download_handler(self, callback, save_directory=None, max_concurrent_downloads=2):
         """
         Setup automatic download handler for captured images
         
+        Downloads run on a small worker pool so the SDK callback returns
+        immediately and the camera can deliver the next transfer request.
+        
         Args:
             callback: Optional callback function(filename, save_path) called after download
             save_directory: Directory to save files (default: current directory)
+            max_concurrent_downloads: Download worker count, capped at 4
+                                      (more tends to provoke DEVICE_BUSY)
             
         Returns:
             The event handler function (keep reference to prevent garbage collection)
         """
-        import os
-        
         if save_directory is None:
             save_directory = os.getcwd()
         
-        downloaded_files = []
+        if callback:
+            self._start_callback_worker()
         
-        def handler(event, obj_ref, context):
-            try:
-                if event == EdsObjectEvent.DirItemRequestTransfer and obj_ref:
-                    # Get file info
-                    info = EdsDirectoryItemInfo()
-                    err = EdsGetDirectoryItemInfo(obj_ref, byref(info))
-                    
-                    if err == EdsErrorCodes.EDS_ERR_OK:
-                        filename = info.szFileName.decode('utf-8', errors='ignore')
-                        save_path = os.path.join(save_directory, filename)
-                        
-                        # Download the file
-                        if self.download_file(obj_ref, save_path):
-                            downloaded_files.append(save_path)
-                            if callback:
-                                callback(filename, save_path)
-                
-                # Always release object reference
-                if obj_ref:
-                    try:
-                        EdsRelease(obj_ref)
-                    except:
-                        pass
-                        
-            except Exception as e:
-                print(f"Handler error: {e}")
-            
-            return EdsErrorCodes.EDS_ERR_OK
+        if self._download_pool is None:
+            self._download_pool = ThreadPoolExecutor(
+                max_workers=max(1, min(max_concurrent_downloads, 4)),
+                thread_name_prefix='edsdk-download',
+                initializer=_init_sdk_thread
+            )
+        
+        # The shared callback picks these up on the next event
+        self._download_callback = callback
+        self._save_directory = save_directory
         
-        # Create callback and register
-        self._object_event_handler = EdsObjectEventHandler(handler)
+        # Register (idempotent if open_session already did)
         err = EdsSetObjectEventHandler(
             self.camera_ref,
             EdsObjectEvent.All,
@@ -882,67 +1862,176 @@ class CanonCamera:
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
+        self.stop_live_view_stream()
+        
         # Set EVF output to camera TFT (off PC)
         try:
             self.set_property(EdsPropertyID_.Evf_OutputDevice, EdsEvfOutputDevice.TFT)
-        except:
+        except (RuntimeError, OSError):
             pass  # Ignore errors if camera disconnected
     
-    def get_live_view_image(self):
+    def _acquire_evf_buffers(self):
+        """Get a (stream, evf_image) pair from the pool, or create a new one"""
+        if self._evf_pool_enabled and self._evf_stream_pool:
+            stream, evf_image = self._evf_stream_pool.pop()
+            EdsSeek(stream, 0, EdsSeekOrigin.Begin)
+            return stream, evf_image
+        
+        # Create memory stream
+        stream = EdsStreamRef()
+        err = EdsCreateMemoryStream(0, byref(stream))
+        if err != EdsErrorCodes.EDS_ERR_OK:
+            return None
+        
+        # Create EVF image reference
+        evf_image = EdsEvfImageRef()
+        err = EdsCreateEvfImageRef(stream, byref(evf_image))
+        if err != EdsErrorCodes.EDS_ERR_OK:
+            EdsRelease(stream)
+            return None
+        
+        return stream, evf_image
+    
+    def _recycle_evf_buffers(self, buffers):
+        """Return a (stream, evf_image) pair to the pool, or release it if the pool is full"""
+        if self._evf_pool_enabled and len(self._evf_stream_pool) < self.EVF_POOL_SIZE:
+            self._evf_stream_pool.append(buffers)
+            return
+        
+        stream, evf_image = buffers
+        EdsRelease(evf_image)
+        EdsRelease(stream)
+    
+    def _drain_evf_pool(self):
+        """Release all pooled Live View buffers"""
+        with self._sdk_lock:
+            while self._evf_stream_pool:
+                stream, evf_image = self._evf_stream_pool.pop()
+                EdsRelease(evf_image)
+                EdsRelease(stream)
+    
+    def get_live_view_image(self, buffer=None):
+        """
+        Capture current Live View image
+        
+        Args:
+            buffer: Optional bytearray to copy the frame into, so one buffer
+                    can be reused across frames. It is never resized; when
+                    a frame doesn't fit, a larger bytearray is allocated
+                    and returned in its place.
+        
+        Returns:
+            bytes: JPEG image data, or None if failed. When buffer is given,
+            a (buffer, size) tuple instead: the frame is buffer[:size], and
+            the returned buffer should be passed to the next call.
+        
+        Example:
+            buf = bytearray(512 * 1024)
+            while streaming:
+                frame = camera.get_live_view_image(buf)
+                if frame is not None:
+                    buf, size = frame
+                    show(memoryview(buf)[:size])
+        """
+        if not self.camera_ref:
+            raise RuntimeError("No camera selected.")
+        
+        # The whole frame transfer runs under the SDK lock so a capture or
+        # download on another thread can't interleave with it
+        with self._sdk_lock:
+            buffers = self._acquire_evf_buffers()
+            if buffers is None:
+                return None
+            stream, evf_image = buffers
+            
+            try:
+                # Download EVF image
+                err = EdsDownloadEvfImage(self.camera_ref, evf_image)
+                if err != EdsErrorCodes.EDS_ERR_OK:
+                    return None
+                
+                # Get image size - position marks the end of this frame in a reused stream
+                length = EdsUInt64()
+                err = EdsGetPosition(stream, byref(length))
+                if err != EdsErrorCodes.EDS_ERR_OK:
+                    return None
+                
+                # Get pointer to data
+                data_ptr = c_void_p()
+                err = EdsGetPointer(stream, byref(data_ptr))
+                if err != EdsErrorCodes.EDS_ERR_OK:
+                    return None
+                
+                size = length.value
+                if buffer is None:
+                    # Copy data to Python bytes (single memcpy)
+                    return string_at(data_ptr.value, size)
+                
+                if len(buffer) < size:
+                    # Views of the old buffer may still be alive; resizing it
+                    # would raise BufferError, so swap in a bigger one instead
+                    buffer = bytearray(size)
+                memmove((c_char * size).from_buffer(buffer), data_ptr.value, size)
+                return buffer, size
+            finally:
+                self._recycle_evf_buffers(buffers)
+    
+    def live_view_session(self, initial_size=0):
         """
-        Capture current Live View image
+        Create a LiveViewSession that reuses one stream across frames
+        
+        Use as a context manager and call grab() for each frame. This is
+        cheaper than get_live_view_image() when polling many frames.
         
         Returns:
-            bytes: JPEG image data, or None if failed
+            LiveViewSession: Unopened session (opened on enter)
         """
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
-        # Create memory stream
-        stream = EdsStreamRef()
-        err = EdsCreateMemoryStream(0, byref(stream))
-        if err != EdsErrorCodes.EDS_ERR_OK:
-            return None
-        
-        # Create EVF image reference
-        evf_image = EdsEvfImageRef()
-        err = EdsCreateEvfImageRef(stream, byref(evf_image))
-        if err != EdsErrorCodes.EDS_ERR_OK:
-            EdsRelease(stream)
-            return None
+        return LiveViewSession(self.camera_ref, initial_size, self._sdk_lock)
+    
+    def start_live_view_stream(self, interval=0.0):
+        """
+        Start downloading Live View frames on a background thread
         
-        # Download EVF image
-        err = EdsDownloadEvfImage(self.camera_ref, evf_image)
-        if err != EdsErrorCodes.EDS_ERR_OK:
-            EdsRelease(evf_image)
-            EdsRelease(stream)
-            return None
+        Call start_live_view() first. Frames are then read with
+        get_live_view_frame() without blocking on the camera.
         
-        # Get image data from stream
-        length = EdsUInt64()
-        err = EdsGetLength(stream, byref(length))
-        if err != EdsErrorCodes.EDS_ERR_OK:
-            EdsRelease(evf_image)
-            EdsRelease(stream)
-            return None
+        Args:
+            interval: Minimum delay between frame downloads in seconds
         
-        # Get pointer to data
-        data_ptr = c_void_p()
-        err = EdsGetPointer(stream, byref(data_ptr))
-        if err != EdsErrorCodes.EDS_ERR_OK:
-            EdsRelease(evf_image)
-            EdsRelease(stream)
-            return None
+        Returns:
+            LiveViewStreamer: The running streamer
+        """
+        if not self.camera_ref:
+            raise RuntimeError("No camera selected.")
         
-        # Copy data to Python bytes
-        image_data = (c_ubyte * length.value).from_address(data_ptr.value)
-        result = bytes(image_data)
+        if self._live_view_streamer is None:
+            streamer = LiveViewStreamer(self.camera_ref, interval, self._sdk_lock)
+            streamer.start()
+            self._live_view_streamer = streamer
+        return self._live_view_streamer
+    
+    def stop_live_view_stream(self):
+        """Stop the background Live View download thread, if running"""
+        if self._live_view_streamer is not None:
+            self._live_view_streamer.stop()
+            self._live_view_streamer = None
+    
+    def get_live_view_frame(self, timeout=None):
+        """
+        Get the newest frame from the background Live View stream
         
-        # Cleanup
-        EdsRelease(evf_image)
-        EdsRelease(stream)
+        Args:
+            timeout: Seconds to wait for a frame (None returns immediately)
         
-        return result
+        Returns:
+            bytes: JPEG image data, or None if no new frame is available
+        """
+        if self._live_view_streamer is None:
+            raise RuntimeError("Live View stream not started. Call start_live_view_stream() first.")
+        return self._live_view_streamer.get_frame(timeout)
     
     # =============================================================================
     # Focus Control Methods
@@ -955,7 +2044,8 @@ class CanonCamera:
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
-        err = EdsSendCommand(self.camera_ref, EdsCameraCommand.DriveLensEvf, speed)
+        with self._sdk_lock:
+            err = EdsSendCommand(self.camera_ref, _DRIVE_LENS_EVF, speed)
         check_error(err, "DriveLensEvf(Near)")
     
     def focus_far(self, speed=3):
@@ -965,7 +2055,8 @@ class CanonCamera:
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
-        err = EdsSendCommand(self.camera_ref, EdsCameraCommand.DriveLensEvf, speed + 0x8000)
+        with self._sdk_lock:
+            err = EdsSendCommand(self.camera_ref, _DRIVE_LENS_EVF, speed + _DRIVE_LENS_FAR)
         check_error(err, "DriveLensEvf(Far)")
     
     def autofocus(self):
@@ -973,8 +2064,32 @@ class CanonCamera:
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
-        err = EdsSendCommand(self.camera_ref, EdsCameraCommand.DoEvfAf, 0)
-        check_error(err, "DoEvfAf")
+        self._send_command(_CMD_EVF_AF, "DoEvfAf")
+    
+    # =============================================================================
+    # Shutter Button Methods
+    # =============================================================================
+    
+    def press_shutter_halfway(self):
+        """Press the shutter button halfway (meter and autofocus)"""
+        if not self.camera_ref:
+            raise RuntimeError("No camera selected.")
+        
+        self._send_command(_CMD_SHUTTER_HALFWAY, "PressShutterButton(Halfway)")
+    
+    def press_shutter_completely(self):
+        """Press the shutter button completely (take a picture)"""
+        if not self.camera_ref:
+            raise RuntimeError("No camera selected.")
+        
+        self._send_command(_CMD_SHUTTER_COMPLETELY, "PressShutterButton(Completely)")
+    
+    def release_shutter_button(self):
+        """Release the shutter button"""
+        if not self.camera_ref:
+            raise RuntimeError("No camera selected.")
+        
+        self._send_command(_CMD_SHUTTER_OFF, "PressShutterButton(OFF)")
     
     # =============================================================================
     # Bulb Mode Methods
@@ -985,16 +2100,14 @@ class CanonCamera:
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
-        err = EdsSendCommand(self.camera_ref, EdsCameraCommand.BulbStart, 0)
-        check_error(err, "BulbStart")
+        self._send_command(_CMD_BULB_START, "BulbStart")
     
     def bulb_end(self):
         """End bulb exposure"""
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
-        err = EdsSendCommand(self.camera_ref, EdsCameraCommand.BulbEnd, 0)
-        check_error(err, "BulbEnd")
+        self._send_command(_CMD_BULB_END, "BulbEnd")
     
     def bulb_exposure(self, duration_seconds):
         """
@@ -1003,7 +2116,6 @@ class CanonCamera:
         Args:
             duration_seconds: Exposure time in seconds
         """
-        import time
         self.bulb_start()
         time.sleep(duration_seconds)
         self.bulb_end()
@@ -1022,7 +2134,7 @@ class CanonCamera:
         try:
             level = self.get_property(EdsPropertyID_.BatteryLevel)
             return level
-        except:
+        except (RuntimeError, OSError):
             return None
     
     def get_available_shots(self):
@@ -1035,21 +2147,21 @@ class CanonCamera:
         try:
             shots = self.get_property(EdsPropertyID_.AvailableShots)
             return shots
-        except:
+        except (RuntimeError, OSError):
             return None
     
     def get_firmware_version(self):
         """Get camera firmware version"""
         try:
             return self.get_property(EdsPropertyID_.FirmwareVersion, as_string=True)
-        except:
+        except (RuntimeError, OSError):
             return "Unknown"
     
     def get_product_name(self):
         """Get camera product name"""
         try:
             return self.get_property(EdsPropertyID_.ProductName, as_string=True)
-        except:
+        except (RuntimeError, OSError):
             return "Unknown"
     
     # =============================================================================
@@ -1060,7 +2172,7 @@ class CanonCamera:
         """Get current ISO setting"""
         try:
             return self.get_property(EdsPropertyID_.ISOSpeed)
-        except:
+        except (RuntimeError, OSError):
             return None
     
     def set_iso(self, iso_value):
@@ -1077,7 +2189,7 @@ class CanonCamera:
         """Get current aperture setting"""
         try:
             return self.get_property(EdsPropertyID_.Av)
-        except:
+        except (RuntimeError, OSError):
             return None
     
     def set_aperture(self, av_value):
@@ -1093,7 +2205,7 @@ class CanonCamera:
         """Get current shutter speed setting"""
         try:
             return self.get_property(EdsPropertyID_.Tv)
-        except:
+        except (RuntimeError, OSError):
             return None
     
     def set_shutter_speed(self, tv_value):
@@ -1145,6 +2257,8 @@ class CanonCamera:
         51200: 0x00000090,
         102400: 0x00000098,
     }
+    _ISO_HEX_TO_VALUE = {code: value for value, code in _ISO_VALUES.items()}
+    _ISO_KEYS_SORTED = sorted(_ISO_VALUES)
     
     # Aperture value mappings (reverse lookup from f-stop to hex)
     _APERTURE_VALUES = {
@@ -1184,6 +2298,8 @@ class CanonCamera:
         29: 0x00000055,
         32: 0x00000058,
     }
+    _APERTURE_HEX_TO_FSTOP = {code: value for value, code in _APERTURE_VALUES.items()}
+    _APERTURE_KEYS_SORTED = sorted(_APERTURE_VALUES)
     
     # Shutter speed value mappings (reverse lookup from string to hex)
     _SHUTTER_VALUES = {
@@ -1255,6 +2371,9 @@ class CanonCamera:
         '1/6400': 0x0000009D,
         '1/8000': 0x000000A0,
     }
+    _SHUTTER_HEX_TO_STR = {code: value for value, code in _SHUTTER_VALUES.items()}
+    _SHUTTER_FRACTIONAL_SORTED = sorted(k for k in _SHUTTER_VALUES if '/' in k)
+    _SHUTTER_LONG_SORTED = sorted(k for k in _SHUTTER_VALUES if '/' not in k and k != 'bulb')
     
     def set_iso_quick(self, iso_value):
         """
@@ -1270,9 +2389,10 @@ class CanonCamera:
         Raises:
             ValueError: If the ISO value is not supported
         """
-        if iso_value not in self._ISO_VALUES:
+        hex_value = self._ISO_VALUES.get(iso_value)
+        if hex_value is None:
             # Try to find closest value
-            available = sorted(self._ISO_VALUES.keys())
+            available = self._ISO_KEYS_SORTED
             closest = min(available, key=lambda x: abs(x - iso_value))
             raise ValueError(
                 f"ISO {iso_value} not directly supported. "
@@ -1281,7 +2401,6 @@ class CanonCamera:
                 f"Use camera.set_iso_quick({closest}) instead."
             )
         
-        hex_value = self._ISO_VALUES[iso_value]
         self.set_iso(hex_value)
     
     def set_aperture_quick(self, f_stop):
@@ -1302,9 +2421,10 @@ class CanonCamera:
             Available apertures depend on the attached lens. Camera must typically
             be in Manual (M) or Aperture Priority (Av) mode.
         """
-        if f_stop not in self._APERTURE_VALUES:
+        hex_value = self._APERTURE_VALUES.get(f_stop)
+        if hex_value is None:
             # Try to find closest value
-            available = sorted(self._APERTURE_VALUES.keys())
+            available = self._APERTURE_KEYS_SORTED
             closest = min(available, key=lambda x: abs(x - f_stop))
             raise ValueError(
                 f"f/{f_stop} not directly supported. "
@@ -1313,7 +2433,6 @@ class CanonCamera:
                 f"Use camera.set_aperture_quick({closest}) instead."
             )
         
-        hex_value = self._APERTURE_VALUES[f_stop]
         self.set_aperture(hex_value)
     
     def set_shutter_speed_quick(self, speed):
@@ -1339,35 +2458,55 @@ class CanonCamera:
         Note:
             Camera must typically be in Manual (M) or Shutter Priority (Tv) mode.
         """
+        if not isinstance(speed, str):
+            speed = str(speed)
+        
+        self.set_shutter_speed(self._resolve_shutter(speed))
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _resolve_shutter(cls, speed):
+        """
+        Map a shutter speed string to its hex value
+        
+        Cached because intervalometer loops pass the same few strings over
+        and over; the lookup tables are constant so the cache never goes stale.
+        
+        Args:
+            speed: Shutter speed string as passed to set_shutter_speed_quick
+        
+        Returns:
+            Hex value for the shutter speed
+        
+        Raises:
+            ValueError: If the shutter speed is not supported
+        """
         # Normalize the input
-        speed_str = str(speed).lower().strip()
+        speed_str = speed.lower().strip()
         
-        if speed_str not in self._SHUTTER_VALUES:
+        hex_value = cls._SHUTTER_VALUES.get(speed_str)
+        if hex_value is None:
             # Try some common variations
             if '/' not in speed_str and speed_str.replace('.', '').isdigit():
                 # User might have entered a decimal like 0.5 or integer like 2
-                # Try to find it in our long exposure values
-                if speed_str not in self._SHUTTER_VALUES:
-                    available = sorted([k for k in self._SHUTTER_VALUES.keys() 
-                                      if '/' not in k and k != 'bulb'])
-                    raise ValueError(
-                        f"Shutter speed '{speed}' not directly supported. "
-                        f"Available long exposures: {available}. "
-                        f"Available fast speeds: 1/60, 1/125, 1/250, 1/500, 1/1000, etc."
-                    )
+                # that is not in our long exposure values
+                available = cls._SHUTTER_LONG_SORTED
+                raise ValueError(
+                    f"Shutter speed '{speed}' not directly supported. "
+                    f"Available long exposures: {available}. "
+                    f"Available fast speeds: 1/60, 1/125, 1/250, 1/500, 1/1000, etc."
+                )
             else:
                 # Show available fractional speeds
-                available_fractions = sorted([k for k in self._SHUTTER_VALUES.keys() if '/' in k])
-                available_long = sorted([k for k in self._SHUTTER_VALUES.keys() 
-                                       if '/' not in k and k != 'bulb'])
+                available_fractions = cls._SHUTTER_FRACTIONAL_SORTED
+                available_long = cls._SHUTTER_LONG_SORTED
                 raise ValueError(
                     f"Shutter speed '{speed}' not directly supported. "
                     f"Available fractional speeds: {available_fractions[:10]}... "
                     f"Available long exposures: {available_long}"
                 )
         
-        hex_value = self._SHUTTER_VALUES[speed_str]
-        self.set_shutter_speed(hex_value)
+        return hex_value
     
     def get_iso_readable(self):
         """
@@ -1380,11 +2519,7 @@ class CanonCamera:
         if hex_value is None:
             return None
         
-        # Reverse lookup
-        for iso, code in self._ISO_VALUES.items():
-            if code == hex_value:
-                return iso
-        return None
+        return self._ISO_HEX_TO_VALUE.get(hex_value)
     
     def get_aperture_readable(self):
         """
@@ -1397,11 +2532,7 @@ class CanonCamera:
         if hex_value is None:
             return None
         
-        # Reverse lookup
-        for f_stop, code in self._APERTURE_VALUES.items():
-            if code == hex_value:
-                return f_stop
-        return None
+        return self._APERTURE_HEX_TO_FSTOP.get(hex_value)
     
     def get_shutter_speed_readable(self):
         """
@@ -1414,17 +2545,13 @@ class CanonCamera:
         if hex_value is None:
             return None
         
-        # Reverse lookup
-        for speed, code in self._SHUTTER_VALUES.items():
-            if code == hex_value:
-                return speed
-        return None
+        return self._SHUTTER_HEX_TO_STR.get(hex_value)
     
     def get_exposure_compensation(self):
         """Get exposure compensation value"""
         try:
             return self.get_property(EdsPropertyID_.ExposureCompensation)
-        except:
+        except (RuntimeError, OSError):
             return None
     
     def set_exposure_compensation(self, value):
@@ -1440,9 +2567,24 @@ class CanonCamera:
         """Get current image quality setting"""
         try:
             return self.get_property(EdsPropertyID_.ImageQuality)
-        except:
+        except (RuntimeError, OSError):
             return None
     
+    def files_per_shot(self):
+        """
+        Get the number of files the camera writes for each capture
+        
+        EdsImageQuality keeps the secondary image in its low 16 bits, where
+        0xff0f means there is none; RAW+JPEG settings give 2.
+        
+        Returns:
+            int: 1 or 2 (1 if the quality can't be read)
+        """
+        quality = self.get_image_quality()
+        if quality is None or quality == 0xFFFFFFFF:
+            return 1
+        return 1 if (quality & 0xFFFF) == 0xFF0F else 2
+    
     def set_image_quality(self, quality_value):
         """
         Set image quality
@@ -1456,29 +2598,74 @@ class CanonCamera:
     # Utility Methods
     # =============================================================================
     
-    def keep_alive(self):
+    def keep_alive(self, force=False):
         """
         Reset shutdown timer to keep camera awake
         Call this periodically during long operations
+        
+        Calls within KEEP_ALIVE_INTERVAL seconds of the last extension are
+        skipped, so it is cheap to call from tight loops.
+        
+        Args:
+            force: Send the command even if the timer was extended recently
         """
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
-        err = EdsSendCommand(self.camera_ref, EdsCameraCommand.ExtendShutDownTimer, 0)
-        check_error(err, "ExtendShutDownTimer")
+        now = time.monotonic()
+        if not force and now - self._last_extend_ts < self.KEEP_ALIVE_INTERVAL:
+            return
+        
+        self._send_command(_CMD_EXTEND_SHUTDOWN_TIMER, "ExtendShutDownTimer")
+        self._last_extend_ts = now
+    
+    # Name used by the SDK command (kEdsCameraCommand_ExtendShutDownTimer)
+    extend_shutdown_timer = keep_alive
     
-    def process_events(self, duration_seconds=0.1):
+    def process_events(self, duration_seconds=0.1, min_idle_ms=None, max_wait_ms=50):
         """
         Process camera events for specified duration
         
+        The thread sleeps in MsgWaitForMultipleObjectsEx() until a message is
+        posted to it (or max_wait_ms passes), then dispatches pending
+        messages and calls EdsGetEvent().
+        
         Args:
             duration_seconds: How long to process events (default: 0.1s)
+            min_idle_ms: Return early once no message has arrived for this
+                         many milliseconds (default: run the full duration)
+            max_wait_ms: Longest single wait before EdsGetEvent() is called
+                         anyway, for events the SDK does not post as messages
         """
-        import time
-        start = time.time()
-        while time.time() - start < duration_seconds:
-            EdsGetEvent()
-            time.sleep(0.01)
+        if self._event_pump_thread is not None:
+            # The pump thread is already dispatching events
+            time.sleep(duration_seconds)
+            return
+        
+        # Integer nanosecond deadline - no float math per iteration
+        msg = wintypes.MSG()
+        now = time.monotonic_ns()
+        deadline = now + int(duration_seconds * 1000000000)
+        idle_ns = None if min_idle_ms is None else int(min_idle_ms * 1000000)
+        last_activity = now
+        
+        while now < deadline:
+            wait_ms = max(1, min((deadline - now) // 1000000, max_wait_ms))
+            # INPUTAVAILABLE also wakes for messages already sitting in the queue
+            result = _MsgWaitForMultipleObjectsEx(0, None, wait_ms, _QS_ALLINPUT,
+                                                  _MWMO_INPUTAVAILABLE)
+            
+            with self._sdk_lock:
+                while _PeekMessageW(byref(msg), None, 0, 0, _PM_REMOVE):
+                    _TranslateMessage(byref(msg))
+                    _DispatchMessageW(byref(msg))
+                EdsGetEvent()
+            
+            now = time.monotonic_ns()
+            if result == _WAIT_OBJECT_0:
+                last_activity = now
+            elif idle_ns is not None and now - last_activity >= idle_ns:
+                break
     
     def wait_for_events(self, timeout_seconds=10, check_interval=0.1):
         """
@@ -1486,14 +2673,107 @@ class CanonCamera:
         
         Args:
             timeout_seconds: Maximum time to wait
-            check_interval: How often to check for events
+            check_interval: Longest single wait between EdsGetEvent() calls
+        """
+        self.process_events(timeout_seconds, max_wait_ms=int(check_interval * 1000))
+    
+    def start_event_pump(self, interval=0.01):
+        """
+        Call EdsGetEvent() on a background thread so camera events are
+        delivered without the caller polling
+        
+        The pump does not run a Win32 message loop, and while it runs
+        process_events() only sleeps. Use it only where the SDK delivers
+        events through EdsGetEvent() alone; otherwise leave it off and let
+        process_events() dispatch messages on the SDK thread.
+        
+        Args:
+            interval: Delay between EdsGetEvent() calls in seconds
+        """
+        if self._event_pump_thread is not None:
+            return
+        
+        self._event_pump_stop.clear()
+        
+        def pump():
+            _init_sdk_thread()
+            while not self._event_pump_stop.is_set():
+                with self._sdk_lock:
+                    EdsGetEvent()
+                self._event_pump_stop.wait(interval)
+        
+        self._event_pump_thread = threading.Thread(target=pump, name="EdsEventPump", daemon=True)
+        self._event_pump_thread.start()
+    
+    def stop_event_pump(self):
+        """Stop the background event pump, if running"""
+        if self._event_pump_thread is not None:
+            self._event_pump_stop.set()
+            self._event_pump_thread.join()
+            self._event_pump_thread = None
+    
+    def wait_for_event(self, kind=None, events=None, timeout=10.0):
+        """
+        Block until a matching camera event arrives
+        
+        Events that do not match are discarded. If the event pump is not
+        running, events are dispatched with process_events() while waiting.
+        
+        Args:
+            kind: 'object', 'property' or 'state' (None matches any)
+            events: Optional collection of SDK event IDs to match
+            timeout: Maximum time to wait in seconds
+        
+        Returns:
+            CameraEvent: The matching event, or None on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            
+            try:
+                if self._event_pump_thread is None:
+                    self.process_events(min(0.01, remaining))
+                    camera_event = self._event_queue.get_nowait()
+                else:
+                    camera_event = self._event_queue.get(timeout=min(0.1, remaining))
+            except queue.Empty:
+                continue
+            
+            if kind is not None and camera_event.kind != kind:
+                continue
+            if events is not None and camera_event.event not in events:
+                continue
+            return camera_event
+    
+    def wait_ready(self, timeout=0.5, count=None):
+        """
+        Wait until the camera reports that the last shot was stored
+        
+        Meant for SaveTo Camera captures, where no download event follows
+        the shot. Returns as soon as the camera has posted DirItemCreated
+        for every file of the shot, so a capture loop only waits as long
+        as the camera actually needs. take_picture() discards object
+        events left over from earlier shots.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            count: DirItemCreated events to wait for (default: files_per_shot())
+        
+        Returns:
+            True if the camera reported all new items, False on timeout
         """
-        import time
-        elapsed = 0
-        while elapsed < timeout_seconds:
-            EdsGetEvent()
-            time.sleep(check_interval)
-            elapsed += check_interval
+        if count is None:
+            count = self.files_per_shot()
+        
+        deadline = time.monotonic() + timeout
+        for _ in range(count):
+            remaining = deadline - time.monotonic()
+            if self.wait_for_event('object', (EdsObjectEvent.DirItemCreated,), remaining) is None:
+                return False
+        return True
     
     def get_camera_info(self):
         """
@@ -1512,17 +2792,176 @@ class CanonCamera:
         info['shutter_speed'] = self.get_shutter_speed()
         return info
     
+    def _enumerate_children(self, dir_ref):
+        """
+        List a directory in one pass before any of its items are used
+        
+        The caller must hold _sdk_lock.
+        
+        Args:
+            dir_ref: Volume or directory item reference to list
+        
+        Returns:
+            list of _DirEntry; the caller must EdsRelease() each item_ref
+        """
+        entries = []
+        item_count, info = _get_listing_scratch()
+        
+        err = EdsGetChildCount(dir_ref, byref(item_count))
+        if err != EdsErrorCodes.EDS_ERR_OK:
+            return entries
+        
+        # Per-item loop runs once per file on the card; bind everything it
+        # touches to locals so each iteration skips the global lookups
+        ok = int(EdsErrorCodes.EDS_ERR_OK)
+        get_child = EdsGetChildAtIndex
+        get_info = EdsGetDirectoryItemInfo
+        new_ref = EdsDirectoryItemRef
+        release = EdsRelease
+        make_entry = _DirEntry
+        decode = _decode_sdk_string
+        append = entries.append
+        info_ptr = byref(info)
+        info_size = sizeof(info)
+        
+        for idx in range(item_count.value):
+            # Each surviving ref needs its own instance until EdsRelease()
+            item_ref = new_ref()
+            if get_child(dir_ref, idx, byref(item_ref)) != ok:
+                continue
+            
+            memset(info_ptr, 0, info_size)
+            if get_info(item_ref, info_ptr) != ok:
+                release(item_ref)
+                continue
+            
+            append(make_entry(item_ref, decode(info.szFileName),
+                              info.size, bool(info.isFolder)))
+        
+        return entries
+    
+    def _scan_volume(self):
+        """
+        Walk the first volume once and return its files, newest first
+        
+        The result is cached for DIR_CACHE_TTL seconds so a
+        get_image_count_on_camera() followed by download_images_from_camera()
+        shares one walk. The cache owns the item refs in the list.
+        
+        Returns:
+            list of _DirEntry for every file on the volume
+        """
+        key = _ref_key(self.camera_ref)
+        now = time.monotonic()
+        cached = self._dir_cache
+        if cached is not None and cached[0] == key and now - cached[1] < self.DIR_CACHE_TTL:
+            return cached[2]
+        
+        self._invalidate_dir_cache()
+        files = list(self._iter_volume_files())
+        
+        self._dir_cache = (key, now, files)
+        return files
+    
+    def _newest_first(self, entries):
+        """
+        Order a directory listing newest first
+        
+        Files keep reverse index order. Folders follow, highest folder
+        number first (102CANON before 101CANON), so the walk reaches the
+        newest images before older folders are listed at all.
+        """
+        files = [entry for entry in reversed(entries) if not entry.is_folder]
+        folders = [entry for entry in entries if entry.is_folder]
+        folders.sort(key=lambda entry: _folder_number(entry.filename), reverse=True)
+        return files + folders
+    
+    def _iter_volume_files(self):
+        """
+        Lazily walk the first volume, yielding files newest first
+        
+        Folders are only listed when the walk reaches them, so a consumer
+        that stops early (max_images) never touches older folders. The
+        consumer owns every yielded item ref; refs listed but not yet
+        yielded are released when the generator is closed.
+        
+        Yields:
+            _DirEntry for each file on the volume
+        """
+        sdk_lock = self._sdk_lock
+        
+        # Get volume
+        volume_count = EdsUInt32()
+        volume_ref = EdsVolumeRef()
+        with sdk_lock:
+            err = EdsGetChildCount(self.camera_ref, byref(volume_count))
+            if err != EdsErrorCodes.EDS_ERR_OK or volume_count.value == 0:
+                return
+            
+            err = EdsGetChildAtIndex(self.camera_ref, 0, byref(volume_ref))
+            if err != EdsErrorCodes.EDS_ERR_OK:
+                return
+            
+            try:
+                root = self._newest_first(self._enumerate_children(volume_ref))
+            finally:
+                EdsRelease(volume_ref)
+        
+        # Explicit stack of per-directory iterators instead of recursion
+        stack = [iter(root)]
+        try:
+            while stack:
+                entry = next(stack[-1], None)
+                if entry is None:
+                    stack.pop()
+                elif entry.is_folder:
+                    # Descend into subdirectory
+                    with sdk_lock:
+                        children = self._enumerate_children(entry.item_ref)
+                        EdsRelease(entry.item_ref)
+                    stack.append(iter(self._newest_first(children)))
+                else:
+                    yield entry
+        finally:
+            with sdk_lock:
+                for remaining in stack:
+                    for entry in remaining:
+                        EdsRelease(entry.item_ref)
+    
+    def _invalidate_dir_cache(self):
+        """Drop the cached volume scan and release its item refs"""
+        cached = self._dir_cache
+        self._dir_cache = None
+        if cached is not None:
+            with self._sdk_lock:
+                for entry in cached[2]:
+                    try:
+                        EdsRelease(entry.item_ref)
+                    except (RuntimeError, OSError):
+                        pass
+    
     def download_images_from_camera(self, save_directory="downloads", 
-                                     callback=None, file_filter=None, max_images=None):
+                                     callback=None, file_filter=None, max_images=None,
+                                     max_concurrent_downloads=3, force=False):
         """
         Download images from camera SD card to computer
         FIXED: Now properly recurses into subdirectories like DCIM/100CANON
         
+        Up to max_concurrent_downloads files are in flight at once; results
+        and callbacks are still handled on the calling thread in order.
+        
+        Files already in save_directory with the same name and size are not
+        transferred again, so an interrupted session can simply be re-run.
+        They are counted separately (see last_skipped_count): they are not
+        returned, don't fire the callback and don't count toward max_images.
+        
         Args:
             save_directory: Directory to save images to
             callback: Optional callback(filename, save_path, index, total)
             file_filter: Optional function to filter files (takes filename, returns bool)
             max_images: Maximum number of images to download (None for all)
+            max_concurrent_downloads: Number of parallel file transfers
+            force: Download even files that already exist locally
         
         Returns:
             list: Paths to downloaded files
@@ -1530,107 +2969,115 @@ class CanonCamera:
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
-        if not os.path.exists(save_directory):
-            os.makedirs(save_directory)
+        os.makedirs(save_directory, exist_ok=True)
         
         downloaded_files = []
         total_downloaded = 0
+        skipped = 0
+        
+        max_in_flight = max(1, max_concurrent_downloads)
+        downloader = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='edsdk-bulk',
+                                        initializer=_init_sdk_thread)
+        in_flight = deque()
         
-        def download_from_directory(dir_ref, depth=0):
-            """Recursively download images from directory"""
+        def finish_oldest():
+            """Wait for the oldest in-flight download and record its result"""
             nonlocal total_downloaded
+            filename, save_path, future = in_flight.popleft()
+            try:
+                ok = future.result()
+            except OSError:
+                ok = False
             
-            if max_images and total_downloaded >= max_images:
-                return
-            
-            item_count = EdsUInt32()
-            err = EdsGetChildCount(dir_ref, byref(item_count))
-            if err != EdsErrorCodes.EDS_ERR_OK:
-                return
-            
-            # Reverse the order to get newest images first
-            for idx in range(item_count.value - 1, -1, -1):
+            if ok:
+                downloaded_files.append(save_path)
+                total_downloaded += 1
+                
+                if callback:
+                    try:
+                        callback(filename, save_path, total_downloaded, max_images)
+                    except Exception as e:
+                        logger.error("Download callback error: %s", e)
+        
+        # Joined once; each file only appends its name
+        save_prefix = os.path.join(save_directory, '')
+        
+        # One directory scan instead of a stat per file
+        existing = set()
+        if not force:
+            with os.scandir(save_directory) as it:
+                for dir_entry in it:
+                    if dir_entry.is_file():
+                        existing.add((dir_entry.name, dir_entry.stat().st_size))
+        
+        # Reuse a fresh scan if there is one; otherwise walk lazily so the
+        # walk stops as soon as max_images is reached
+        cached = self._dir_cache
+        if (cached is not None and cached[0] == _ref_key(self.camera_ref)
+                and time.monotonic() - cached[1] < self.DIR_CACHE_TTL):
+            # Take ownership of the scan so a later invalidation can't
+            # release refs that are still being downloaded
+            self._dir_cache = None
+            source = cached[2]
+        else:
+            source = self._iter_volume_files()
+        entries = iter(source)
+        consumed = []
+        
+        try:
+            while True:
+                # Don't schedule past max_images; a failed transfer frees its slot.
+                # Checked before pulling the next entry so the walk stops early
+                while in_flight and max_images and total_downloaded + len(in_flight) >= max_images:
+                    finish_oldest()
                 if max_images and total_downloaded >= max_images:
                     break
                 
-                item_ref = EdsDirectoryItemRef()
-                err = EdsGetChildAtIndex(dir_ref, idx, byref(item_ref))
-                if err != EdsErrorCodes.EDS_ERR_OK:
+                entry = next(entries, None)
+                if entry is None:
+                    break
+                consumed.append(entry)
+                
+                filename = entry.filename
+                
+                # Apply filter if provided
+                if file_filter and not file_filter(filename):
                     continue
                 
-                info = EdsDirectoryItemInfo()
-                err = EdsGetDirectoryItemInfo(item_ref, byref(info))
-                if err != EdsErrorCodes.EDS_ERR_OK:
-                    EdsRelease(item_ref)
+                save_path = save_prefix + filename
+                
+                if (filename, entry.size) in existing:
+                    skipped += 1
                     continue
                 
-                if info.isFolder:
-                    # Recurse into subdirectory
-                    download_from_directory(item_ref, depth + 1)
-                    EdsRelease(item_ref)
-                else:
-                    # Download this file
-                    try:
-                        filename = info.szFileName.decode('utf-8', errors='ignore')
-                        
-                        # Apply filter if provided
-                        if file_filter and not file_filter(filename):
-                            EdsRelease(item_ref)
-                            continue
-                        
-                        # Create file stream
-                        save_path = os.path.join(save_directory, filename)
-                        
-                        # CRITICAL: Create empty file first - SDK requires file to exist!
-                        with open(save_path, 'wb') as f:
-                            pass  # Create empty file
-                            
-                        stream = EdsStreamRef()
-                        err = EdsCreateFileStream(
-                            save_path.encode('utf-8'),
-                            EdsFileCreateDisposition.CreateAlways,
-                            EdsAccess.Write,
-                            byref(stream)
-                        )
-                        
-                        if err == EdsErrorCodes.EDS_ERR_OK:
-                            # Download
-                            err = EdsDownload(item_ref, info.size, stream)
-                            if err == EdsErrorCodes.EDS_ERR_OK:
-                                err = EdsDownloadComplete(item_ref)
-                                if err == EdsErrorCodes.EDS_ERR_OK:
-                                    downloaded_files.append(save_path)
-                                    total_downloaded += 1
-                                    
-                                    if callback:
-                                        callback(filename, save_path, total_downloaded, max_images)
-                            
-                            EdsRelease(stream)
-                    except:
-                        pass
-                    
-                    EdsRelease(item_ref)
-        
-        try:
-            # Get volume
-            volume_count = EdsUInt32()
-            err = EdsGetChildCount(self.camera_ref, byref(volume_count))
-            if err != EdsErrorCodes.EDS_ERR_OK or volume_count.value == 0:
-                return downloaded_files
-            
-            volume_ref = EdsVolumeRef()
-            err = EdsGetChildAtIndex(self.camera_ref, 0, byref(volume_ref))
-            if err != EdsErrorCodes.EDS_ERR_OK:
-                return downloaded_files
-            
-            # Download all images recursively
-            download_from_directory(volume_ref)
-            
-            EdsRelease(volume_ref)
+                # Bounded queue keeps memory flat on large cards
+                if len(in_flight) >= max_in_flight:
+                    finish_oldest()
+                in_flight.append((filename, save_path, downloader.submit(
+                    self._download_to_path, entry.item_ref, entry.size, save_path)))
             
         except Exception as e:
-            print(f"Error during bulk download: {e}")
-        
+            logger.error("Error during bulk download: %s", e)
+        finally:
+            # Item refs must outlive the transfers that use them
+            while in_flight:
+                try:
+                    finish_oldest()
+                except Exception as e:
+                    logger.error("Error during bulk download: %s", e)
+            downloader.shutdown(wait=True)
+            if isinstance(source, list):
+                consumed = source
+            else:
+                # Releases refs the walk listed but never yielded
+                source.close()
+            with self._sdk_lock:
+                for entry in consumed:
+                    EdsRelease(entry.item_ref)
+        
+        self.last_skipped_count = skipped
+        if skipped:
+            logger.info("Skipped %d files already in %s", skipped, save_directory)
         return downloaded_files
     
     def get_image_count_on_camera(self):
@@ -1644,55 +3091,66 @@ class CanonCamera:
         if not self.camera_ref:
             raise RuntimeError("No camera selected.")
         
-        def count_images_recursive(parent_ref):
-            """Recursively count images in a directory"""
-            total = 0
-            
-            item_count = EdsUInt32()
-            err = EdsGetChildCount(parent_ref, byref(item_count))
-            if err != EdsErrorCodes.EDS_ERR_OK:
-                return 0
-            
-            for idx in range(item_count.value):
-                item_ref = EdsDirectoryItemRef()
-                err = EdsGetChildAtIndex(parent_ref, idx, byref(item_ref))
-                if err != EdsErrorCodes.EDS_ERR_OK:
-                    continue
-                
-                info = EdsDirectoryItemInfo()
-                err = EdsGetDirectoryItemInfo(item_ref, byref(info))
-                if err == EdsErrorCodes.EDS_ERR_OK:
-                    if info.isFolder:
-                        # Recurse into subdirectory
-                        total += count_images_recursive(item_ref)
-                    else:
-                        # Count this file
-                        total += 1
-                
-                EdsRelease(item_ref)
-            
-            return total
-        
         try:
-            # Get volume
-            volume_count = EdsUInt32()
-            err = EdsGetChildCount(self.camera_ref, byref(volume_count))
-            if err != EdsErrorCodes.EDS_ERR_OK or volume_count.value == 0:
-                return 0
-            
-            volume_ref = EdsVolumeRef()
-            err = EdsGetChildAtIndex(self.camera_ref, 0, byref(volume_ref))
-            if err != EdsErrorCodes.EDS_ERR_OK:
-                return 0
-            
-            # Count all images recursively starting from volume
-            total_images = count_images_recursive(volume_ref)
-            
-            EdsRelease(volume_ref)
-            return total_images
-            
-        except:
+            return len(self._scan_volume())
+        except (RuntimeError, OSError):
             return 0
+    
+    def refresh_volume_cache(self):
+        """
+        Re-read the card's directory tree without reopening the session
+        
+        Drops the cached scan and walks the volume again, so files written
+        since the last scan are picked up. The fresh scan is shared with a
+        following get_image_count_on_camera() or
+        download_images_from_camera() call.
+        
+        Returns:
+            int: Number of images on camera
+        """
+        self._invalidate_dir_cache()
+        return self.get_image_count_on_camera()
+    
+    def start_background_download(self, save_directory, max_workers=2, callback=None):
+        """
+        Download new images from the card while capture continues
+        
+        Use with SaveTo Camera: images shot after this call are downloaded
+        in the background, so a session takes roughly max(capture, download)
+        time instead of their sum. New files are picked up from
+        DirItemCreated events, so keep dispatching events while shooting
+        (wait_ready() and process_events() do).
+        
+        Args:
+            save_directory: Directory to save images to
+            max_workers: Number of download threads (2-4 recommended)
+            callback: Optional callback(filename, save_path) per downloaded file
+        """
+        if not self.camera_ref:
+            raise RuntimeError("No camera selected.")
+        
+        if self._background_downloader is not None:
+            return
+        
+        downloader = BackgroundDownloader(self, save_directory, max_workers, callback)
+        downloader.start()
+        self._background_downloader = downloader
+    
+    def stop_background_download(self):
+        """
+        Finish pending background downloads and stop
+        
+        Returns:
+            list: Paths of files downloaded in the background
+        """
+        downloader = self._background_downloader
+        if downloader is None:
+            return []
+        
+        # Stays registered while stop() dispatches the last events
+        files = downloader.stop()
+        self._background_downloader = None
+        return files
 
     
     # =============================================================================
@@ -1728,8 +3186,8 @@ with CanonCamera() as camera:
         camera.open_session()
         camera.set_save_to(EdsSaveTo.Host)
         camera.set_capacity(0x7FFFFFFF, 0x1000)
-        camera.take_picture()
-        camera.process_events(5)  # Wait for download
+        camera.setup_download_handler(None)
+        camera.take_picture(wait=True)  # Returns once the image is saved
     """)
     
     print("""
@@ -1754,8 +3212,7 @@ with CanonCamera() as camera:
     )
     
     # Take picture - will auto-download
-    camera.take_picture()
-    camera.wait_for_events(10)
+    camera.take_picture(wait=True, timeout=10)
     """)
     
     print("""
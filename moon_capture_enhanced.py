@@ -12,7 +12,7 @@ STANDARD MODE:
 FAST MODE:
 - Images save to camera SD card during shooting
 - Much faster capture rate (~0.5-1 second per shot)
-- Bulk download after capture completes
+- New images download in the background while shooting continues
 - Better for larger sessions
 
 Features:
@@ -22,13 +22,25 @@ Features:
 - Comprehensive error handling
 - Detailed session statistics
 - Progress tracking
+
+Unattended runs skip the menus and prompts:
+    python moon_capture_enhanced.py --mode fast --preset full_moon --yes
 """
 
 from canon_edsdk import CanonCamera, EdsSaveTo
 import time
 from datetime import datetime
+import argparse
 import os
+import sys
 import json
+import logging
+import queue
+import threading
+from array import array
+from collections import deque
+
+logger = logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -90,22 +102,121 @@ PRESETS = {
     }
 }
 
+# Derived once at import - PRESETS is not modified at runtime
+PRESET_TOTAL_FRAMES = {
+    name: sum(b['frames'] for b in preset['brackets'])
+    for name, preset in PRESETS.items()
+}
+
+PRESET_BRACKET_LINES = {
+    name: tuple(
+        f"{b['name']}: ISO {b['iso']}, f/{b['aperture']}, {b['shutter']} × {b['frames']} frames"
+        for b in preset['brackets']
+    )
+    for name, preset in PRESETS.items()
+}
+
+
+def _settings_key(bracket_config):
+    """Exposure settings of a bracket, comparable across brackets"""
+    return (bracket_config['iso'], round(bracket_config['aperture'], 2), bracket_config['shutter'])
+
+
+class SessionLogWriter:
+    """
+    Append session records to a JSON Lines file from a background thread
+    
+    The capture loop only queues a small dict per frame; encoding and disk
+    writes happen on the writer thread so they never delay the next shot.
+    Records are written in batches unless queued with flush=True, so each
+    finished bracket is on disk even if the session is interrupted.
+    """
+    
+    BATCH_SIZE = 32
+    
+    def __init__(self, path):
+        self.path = path
+        self._queue = queue.Queue()
+        self._thread = None
+        
+    def start(self):
+        """Start the writer thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+            
+    def log(self, record, flush=False):
+        """Queue a record for writing; flush=True writes the batch right away"""
+        self._queue.put((record, flush))
+        
+    def close(self):
+        """Flush pending records and stop the writer thread"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+            
+    def _run(self):
+        batch = []
+        while True:
+            item = self._queue.get()
+            flush = item is None
+            if item is not None:
+                record, flush = item
+                batch.append(record)
+            if batch and (flush or len(batch) >= self.BATCH_SIZE):
+                self._write(batch)
+                batch = []
+            if item is None:
+                return
+                
+    def _write(self, batch):
+        lines = ''.join(
+            json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+            for record in batch
+        )
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+        except OSError as e:
+            logger.error("Could not write session log %s: %s", self.path, e)
+
 
 class EnhancedMoonCapture:
     """Enhanced moon capture with multiple capture modes"""
     
-    def __init__(self, save_directory=None, fast_mode=False):
+    # Transfers kept in flight by bulk_download_images; each one writes
+    # finished blocks to disk while the next block comes over USB
+    BULK_DOWNLOAD_WORKERS = 3
+    
+    # Minimum seconds between progress redraws
+    PROGRESS_INTERVAL = 0.1
+    
+    # Most recent error messages kept for the summary
+    MAX_LOGGED_ERRORS = 500
+    
+    def __init__(self, save_directory=None, fast_mode=False, assume_yes=False, on_warn='ask'):
         self.camera = None
+        self.assume_yes = assume_yes  # Skip plain confirmations
+        self.on_warn = on_warn  # 'ask', 'abort' or 'continue' on warnings
         self.save_directory = save_directory or f"moon_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.abs_save_directory = os.path.abspath(self.save_directory)
         self.fast_mode = fast_mode
         self.total_shots = 0
         self.successful_shots = 0
+        self.error_count = 0
         self.session_start = None
+        self.session_start_ns = 0
+        self.session_date = None
+        self.session_log = None
         self.images_before_capture = 0
+        self.background_files = []  # Saved by the background downloader
+        self._applied = None  # (iso, aperture, shutter) last applied and verified
+        self._verified_once = False  # Fast mode trusts settings after one good readback
         self.session_stats = {
             'mode': 'fast' if fast_mode else 'standard',
             'brackets': [],
-            'errors': []
+            'errors': deque(maxlen=self.MAX_LOGGED_ERRORS)
         }
         
     def setup_camera(self):
@@ -142,7 +253,6 @@ class EnhancedMoonCapture:
         if self.fast_mode:
             print("\nConfiguring for FAST capture mode...")
             print("✓ Images will save to camera SD card during shooting")
-            print("✓ Bulk download will occur after capture completes")
             
             # Set to save to camera only
             self.camera.set_save_to(EdsSaveTo.Camera)
@@ -157,8 +267,7 @@ class EnhancedMoonCapture:
             
             if available_shots < 100:
                 print("⚠ WARNING: Low space on SD card!")
-                response = input("Continue anyway? (y/n): ")
-                if response.lower() != "y":
+                if not self.confirm("Continue anyway? (y/n): ", warning=True):
                     raise RuntimeError("Cancelled due to low space")
         else:
             print("\nConfiguring for STANDARD capture mode...")
@@ -175,12 +284,29 @@ class EnhancedMoonCapture:
             )
         
         # Create directory
-        if not os.path.exists(self.save_directory):
+        try:
             os.makedirs(self.save_directory)
             print(f"✓ Created: {self.save_directory}")
+        except FileExistsError:
+            pass
         
         print("✓ Camera ready!")
         
+    def confirm(self, prompt, warning=False):
+        """
+        Ask a yes/no question unless the answer was given up front
+        
+        Args:
+            prompt: Question shown when asking interactively
+            warning: The question is about continuing past a warning, which
+                     follows on_warn instead of assume_yes
+        """
+        if warning and self.on_warn != 'ask':
+            return self.on_warn == 'continue'
+        if self.assume_yes and not warning:
+            return True
+        return input(prompt).lower() == 'y'
+        
     def on_image_downloaded(self, filename, save_path):
         """Callback for downloaded images"""
         self.successful_shots += 1
@@ -200,30 +326,33 @@ class EnhancedMoonCapture:
         """
         Verify that settings were applied correctly
         Returns True if all match, False otherwise
+        
+        Each readback is a USB round-trip, so checking stops at the first
+        mismatch; the cheap exact comparisons (ISO, shutter) go first.
         """
         try:
             actual_iso = self.camera.get_iso_readable()
-            actual_aperture = self.camera.get_aperture_readable()
-            actual_shutter = self.camera.get_shutter_speed_readable()
+            if actual_iso != target_iso:
+                return self._report_mismatch('ISO', target_iso, actual_iso)
             
-            iso_match = actual_iso == target_iso
-            aperture_match = abs(actual_aperture - target_aperture) < 0.1 if actual_aperture else False
-            shutter_match = actual_shutter == target_shutter
+            actual_shutter = self.camera.get_shutter_speed_readable()
+            if actual_shutter != target_shutter:
+                return self._report_mismatch('Shutter', target_shutter, actual_shutter)
             
-            if not (iso_match and aperture_match and shutter_match):
-                print(f"  ⚠ Settings mismatch!")
-                if not iso_match:
-                    print(f"    ISO: expected {target_iso}, got {actual_iso}")
-                if not aperture_match:
-                    print(f"    Aperture: expected {target_aperture}, got {actual_aperture}")
-                if not shutter_match:
-                    print(f"    Shutter: expected {target_shutter}, got {actual_shutter}")
-                return False
+            actual_aperture = self.camera.get_aperture_readable()
+            if not actual_aperture or abs(actual_aperture - target_aperture) >= 0.1:
+                return self._report_mismatch('Aperture', target_aperture, actual_aperture)
             
             return True
         except:
             return False
             
+    def _report_mismatch(self, setting, expected, actual):
+        """Print a settings mismatch and return False"""
+        print(f"  ⚠ Settings mismatch!")
+        print(f"    {setting}: expected {expected}, got {actual}")
+        return False
+            
     def capture_bracket(self, bracket_config):
         """
         Capture a single bracket
@@ -251,108 +380,181 @@ class EnhancedMoonCapture:
             'failed': 0,
             'start_time': time.time()
         }
+        bracket_started = time.perf_counter()
         
-        # Apply settings
-        settings_ok = True
+        # Apply settings, unless the previous bracket already left the
+        # camera at the same verified settings
+        key = _settings_key(bracket_config)
         
-        try:
-            print("\nApplying settings...")
-            self.camera.set_iso_quick(iso)
-            time.sleep(0.3)
-            self.camera.set_aperture_quick(aperture)
-            time.sleep(0.3)
-            self.camera.set_shutter_speed_quick(shutter)
-            time.sleep(0.5)
+        if key == self._applied:
+            print("\n✓ Settings unchanged from previous bracket")
+        else:
+            self._applied = None
+            settings_ok = True
             
-            # Verify
-            if not self.verify_settings(iso, aperture, shutter):
+            try:
+                print("\nApplying settings...")
+                self.camera.set_iso_quick(iso)
+                time.sleep(0.3)
+                self.camera.set_aperture_quick(aperture)
+                time.sleep(0.3)
+                self.camera.set_shutter_speed_quick(shutter)
+                time.sleep(0.5)
+                
+                # Verify - in fast mode only until one bracket has verified
+                verify = not (self.fast_mode and self._verified_once)
+                if verify and not self.verify_settings(iso, aperture, shutter):
+                    settings_ok = False
+                    print("  ⚠ Settings could not be verified!")
+                    print("  Camera must be in Manual (M) mode!")
+                    if not self.confirm("  Continue anyway? (y/n): ", warning=True):
+                        return bracket_stats
+                        
+            except Exception as e:
+                print(f"✗ Error applying settings: {e}")
                 settings_ok = False
-                print("  ⚠ Settings could not be verified!")
-                print("  Camera must be in Manual (M) mode!")
-                response = input("  Continue anyway? (y/n): ")
-                if response.lower() != 'y':
-                    return bracket_stats
-                    
-        except Exception as e:
-            print(f"✗ Error applying settings: {e}")
-            settings_ok = False
-            
-        if settings_ok:
-            self.show_current_settings()
-            print("  ✓ Settings verified")
+                
+            if settings_ok:
+                if not self.fast_mode:
+                    self.show_current_settings()
+                if verify:
+                    print("  ✓ Settings verified")
+                    self._verified_once = True
+                else:
+                    print("  ✓ Settings applied")
+                self._applied = key
         
         # Capture loop
         print("\nCapturing frames...")
         failed_captures = 0
         
-        # Different timing based on mode
+        # Time of each successful shot, pre-sized so the loop never allocates
+        shot_times = array('d', bytes(8 * frames))
+        taken = 0
+        
+        # Different timing based on mode; both are upper bounds, the loop
+        # moves on as soon as the camera reports the shot
         if self.fast_mode:
             # Fast mode - minimal delay between shots
-            process_time = 0.5  # Just enough for camera to be ready
+            process_time = 0.5  # Until the image is stored on the card
             print("FAST MODE: Minimal delay between shots")
         else:
             # Standard mode - wait for download
-            process_time = 2.5  # Wait for download to complete
+            # Until the download has been saved; RAW (+JPEG) transfers can
+            # take several seconds over USB
+            process_time = 10.0
             print("STANDARD MODE: Waiting for download after each shot")
         
+        last_render = float('-inf')
+        
+        # Every possible bar, built once per bracket
+        bar_length = 40
+        bars = ['█' * filled + '░' * (bar_length - filled) for filled in range(bar_length + 1)]
+        
         for i in range(1, frames + 1):
             self.total_shots += 1
+            shot_ok = False
             
             try:
-                # Progress indicator
-                progress = (i / frames) * 100
-                bar_length = 40
-                filled = int(bar_length * i / frames)
-                bar = '█' * filled + '░' * (bar_length - filled)
-                
-                print(f'\r  [{bar}] {progress:5.1f}% - Frame {i}/{frames}', end='', flush=True)
+                # Progress indicator, redrawn at most every PROGRESS_INTERVAL
+                now = time.monotonic()
+                if now - last_render >= self.PROGRESS_INTERVAL or i == frames:
+                    last_render = now
+                    progress = (i / frames) * 100
+                    bar = bars[bar_length * i // frames]
+                    
+                    sys.stdout.write(f'\r  [{bar}] {progress:5.1f}% - Frame {i}/{frames}')
+                    sys.stdout.flush()
                 
                 # Capture
-                self.camera.take_picture()
-                
                 if self.fast_mode:
+                    self.camera.take_picture()
                     # Fast mode - just increment counter
                     bracket_stats['successful'] += 1
-                    # Minimal processing - just enough for camera to be ready
-                    time.sleep(process_time)
+                    # Continue once the camera has stored the image
+                    self.camera.wait_ready(process_time)
                 else:
-                    # Standard mode - wait for download
-                    self.camera.process_events(process_time)
+                    # Standard mode - continue once the download is saved
+                    if not self.camera.take_picture(wait=True, timeout=process_time):
+                        # The shot was taken; the file still arrives via the handler
+                        logger.warning("Frame %d: download not saved after %.0f s, continuing",
+                                       i, process_time)
                     bracket_stats['successful'] += 1
-                    # Small additional delay
-                    time.sleep(0.3)
+                shot_ok = True
+                shot_times[taken] = time.perf_counter()
+                taken += 1
                 
             except Exception as e:
                 failed_captures += 1
                 bracket_stats['failed'] += 1
+                self.error_count += 1
                 self.session_stats['errors'].append(f"Frame {i}: {str(e)}")
                 
                 if failed_captures > 5:
                     print(f"\n\n✗ Too many failures ({failed_captures}). Stopping bracket.")
                     break
                     
+            finally:
+                if self.session_log:
+                    self.session_log.log({
+                        'type': 'shot',
+                        'bracket': name,
+                        'frame': i,
+                        'ok': shot_ok,
+                        'elapsed_ms': (time.monotonic_ns() - self.session_start_ns) // 1000000,
+                    })
+                    
         print()  # New line after progress bar
         
         # Stats
+        # Wall-clock times are kept for the log; the duration is measured
+        # with perf_counter so clock adjustments can't skew it
         bracket_stats['end_time'] = time.time()
-        bracket_stats['duration'] = bracket_stats['end_time'] - bracket_stats['start_time']
+        bracket_stats['duration'] = time.perf_counter() - bracket_started
+        if taken > 1:
+            bracket_stats['mean_interval'] = (shot_times[taken - 1] - shot_times[0]) / (taken - 1)
+            bracket_stats['max_interval'] = max(
+                shot_times[k + 1] - shot_times[k] for k in range(taken - 1)
+            )
         self.session_stats['brackets'].append(bracket_stats)
+        if self.session_log:
+            self.session_log.log({'type': 'bracket', **bracket_stats}, flush=True)
         
         success_rate = (bracket_stats['successful'] / frames * 100) if frames > 0 else 0
         print(f"\n✓ Bracket complete: {bracket_stats['successful']}/{frames} successful ({success_rate:.1f}%)")
         
+        if 'mean_interval' in bracket_stats:
+            print(f"  Shot interval: {bracket_stats['mean_interval']:.2f}s average, "
+                  f"{bracket_stats['max_interval']:.2f}s longest")
+        
         if failed_captures > 0:
             print(f"  ⚠ {failed_captures} failed captures")
-        
-        # Pause before next bracket
-        if frames > 0:
-            print("  Waiting 3 seconds...")
-            time.sleep(3)
             
         return bracket_stats
         
-    def bulk_download_images(self):
-        """Download all newly captured images from camera (Fast mode only)"""
+    def _bracket_pause(self, bracket_config, next_config):
+        """
+        Seconds to let the camera settle between two brackets
+        
+        No pause is needed when the next bracket keeps the same settings.
+        In fast mode the pause only has to cover the card buffer draining.
+        """
+        if bracket_config['frames'] == 0 or _settings_key(bracket_config) == _settings_key(next_config):
+            return 0.0
+        if self.fast_mode:
+            return min(3.0, max(0.5, bracket_config['frames'] * 0.02))
+        return 3.0
+        
+    def bulk_download_images(self, already_downloaded=0):
+        """
+        Download newly captured images from camera (Fast mode only)
+        
+        Args:
+            already_downloaded: New images already saved by the background
+                                downloader; files already in the save
+                                directory are skipped and the rest of the
+                                newest images are fetched
+        """
         if not self.fast_mode:
             print("Bulk download only available in FAST mode")
             return []
@@ -361,20 +563,15 @@ class EnhancedMoonCapture:
         print("BULK DOWNLOAD FROM CAMERA")
         print("="*70)
         
-        # Force cache refresh by closing/reopening session
-        print("\nRefreshing camera connection to detect new images...")
-        self.camera.close_session()
-        time.sleep(0.5)
-        self.camera.get_camera(0)
-        self.camera.open_session()
-        time.sleep(0.5)
-        
-        print("Counting images on camera...")
-        current_count = self.camera.get_image_count_on_camera()
-        new_images = current_count - self.images_before_capture
+        # Re-walk the card so images written during capture are seen
+        print("\nCounting images on camera...")
+        current_count = self.camera.refresh_volume_cache()
+        new_images = current_count - self.images_before_capture - already_downloaded
         
         print(f"Images before capture: {self.images_before_capture}")
         print(f"Images on camera now: {current_count}")
+        if already_downloaded:
+            print(f"Already downloaded: {already_downloaded}")
         print(f"New images to download: {new_images}")
         
         if new_images <= 0:
@@ -384,29 +581,39 @@ class EnhancedMoonCapture:
         print(f"\nDownloading {new_images} images to: {self.save_directory}")
         print("This may take a few minutes...\n")
         
-        download_start = time.time()
+        download_start = time.perf_counter()
         downloaded_count = [0]
+        last_render = [float('-inf')]
         
         def progress_callback(filename, path, index, total):
             downloaded_count[0] += 1
+            self.successful_shots += 1
+            
+            # Files already on disk are reported in quick bursts; coalesce them
+            now = time.monotonic()
+            if now - last_render[0] < self.PROGRESS_INTERVAL and index != new_images:
+                return
+            last_render[0] = now
             percent = (index / new_images * 100) if new_images > 0 else 0
             print(f"  [{index}/{new_images}] ({percent:.0f}%) {filename}")
-            self.successful_shots += 1
         
         downloaded_files = self.camera.download_images_from_camera(
             save_directory=self.save_directory,
             callback=progress_callback,
             max_images=new_images,
+            max_concurrent_downloads=self.BULK_DOWNLOAD_WORKERS,
         )
         
-        download_time = time.time() - download_start
+        download_time = time.perf_counter() - download_start
         
         print(f"\n✓ Download complete!")
         print(f"  Downloaded: {len(downloaded_files)} files")
+        if self.camera.last_skipped_count:
+            print(f"  Skipped (already saved): {self.camera.last_skipped_count} files")
         print(f"  Time: {download_time:.1f} seconds")
         if download_time > 0:
             print(f"  Rate: {len(downloaded_files)/download_time:.1f} files/second")
-        print(f"  Location: {os.path.abspath(self.save_directory)}")
+        print(f"  Location: {self.abs_save_directory}")
         
         return downloaded_files
         
@@ -423,7 +630,7 @@ class EnhancedMoonCapture:
         print(f"{preset['description']}")
         print(f"\nBrackets: {len(preset['brackets'])}")
         
-        total_frames = sum(b['frames'] for b in preset['brackets'])
+        total_frames = PRESET_TOTAL_FRAMES[preset_name]
         
         # Estimate time based on mode
         if self.fast_mode:
@@ -445,10 +652,8 @@ class EnhancedMoonCapture:
         
         # Show all brackets
         print("Bracket details:")
-        for i, bracket in enumerate(preset['brackets'], 1):
-            print(f"  {i}. {bracket['name']}: "
-                  f"ISO {bracket['iso']}, f/{bracket['aperture']}, "
-                  f"{bracket['shutter']} × {bracket['frames']} frames")
+        for i, line in enumerate(PRESET_BRACKET_LINES[preset_name], 1):
+            print(f"  {i}. {line}")
         
         print("\n" + "="*70)
         print("IMPORTANT REMINDERS:")
@@ -459,26 +664,60 @@ class EnhancedMoonCapture:
         print("  ✓ RAW format selected")
         print("="*70)
         
-        response = input("\nReady to start capture? (y/n): ")
-        if response.lower() != 'y':
+        if not self.confirm("\nReady to start capture? (y/n): "):
             print("Capture cancelled.")
             return
             
         # Start session
-        self.session_start = time.time()
+        self.session_start = time.perf_counter()
+        self.session_date = datetime.now().isoformat()
         print("\nStarting capture session...")
         time.sleep(2)
         
+        # Session records are written off the capture thread
+        self.session_start_ns = time.monotonic_ns()
+        self.session_log = SessionLogWriter(os.path.join(self.save_directory, 'session_info.jsonl'))
+        self.session_log.start()
+        
+        # In fast mode, download new images while later ones are being shot
+        if self.fast_mode:
+            self.camera.start_background_download(
+                self.save_directory,
+                callback=self.on_image_downloaded
+            )
+        
         # Capture each bracket
-        for bracket in preset['brackets']:
-            self.capture_bracket(bracket)
+        brackets = preset['brackets']
+        completed = False
+        try:
+            for index, bracket in enumerate(brackets):
+                self.capture_bracket(bracket)
+                
+                # Pause before next bracket; events keep flowing meanwhile
+                if index + 1 < len(brackets):
+                    pause = self._bracket_pause(bracket, brackets[index + 1])
+                    if pause > 0:
+                        print(f"  Waiting {pause:.1f} seconds...")
+                        self.camera.process_events(pause)
+            completed = True
+        finally:
+            # Stop the background downloader before anything else (e.g. a
+            # bulk download after Ctrl+C) touches the same files
+            if self.fast_mode:
+                if completed:
+                    print("\n" + "="*70)
+                    print("CAPTURE COMPLETE - FINISHING BACKGROUND DOWNLOAD")
+                    print("="*70)
+                self.background_files = self.camera.stop_background_download()
             
-        # If in fast mode, do bulk download
+        # If in fast mode, catch up on anything the background download missed
         if self.fast_mode:
-            print("\n" + "="*70)
-            print("CAPTURE COMPLETE - STARTING BULK DOWNLOAD")
-            print("="*70)
-            self.bulk_download_images()
+            captured = sum(b['successful'] for b in self.session_stats['brackets'])
+            print(f"✓ Downloaded during capture: {len(self.background_files)}/{captured}")
+            
+            if len(self.background_files) < captured:
+                print("Some images were missed - running bulk download...")
+                self.bulk_download_images(len(self.background_files))
             
         # Session complete
         self.print_session_summary()
@@ -490,15 +729,15 @@ class EnhancedMoonCapture:
         print("="*70)
         
         if self.session_start:
-            session_duration = time.time() - self.session_start
+            session_duration = time.perf_counter() - self.session_start
             print(f"\nSession duration: {session_duration/60:.1f} minutes")
         
-        print(f"Capture mode: {'FAST' if self.fast_mode else 'STANDARD'}")
+        print(f"Capture mode: {self.session_stats['mode'].upper()}")
         print(f"Total shots: {self.successful_shots}/{self.total_shots}")
         success_rate = (self.successful_shots / self.total_shots * 100) if self.total_shots > 0 else 0
         print(f"Success rate: {success_rate:.1f}%")
         
-        print(f"\nSaved to: {os.path.abspath(self.save_directory)}")
+        print(f"\nSaved to: {self.abs_save_directory}")
         
         # Bracket breakdown
         print("\nBracket Summary:")
@@ -508,27 +747,37 @@ class EnhancedMoonCapture:
                   f"({bracket['duration']:.1f}s)")
         
         # Errors
-        if self.session_stats['errors']:
-            print(f"\nErrors encountered: {len(self.session_stats['errors'])}")
-            if len(self.session_stats['errors']) <= 5:
+        if self.error_count:
+            print(f"\nErrors encountered: {self.error_count}")
+            if self.error_count <= 5:
                 for error in self.session_stats['errors']:
                     print(f"  • {error}")
         
-        # Save session info
+        # Save session info: the consolidated summary, plus a final record
+        # for the per-shot log written during capture
         session_info = {
-            'date': datetime.now().isoformat(),
-            'mode': 'fast' if self.fast_mode else 'standard',
+            'date': self.session_date or datetime.now().isoformat(),
+            'mode': self.session_stats['mode'],
             'total_shots': self.total_shots,
             'successful_shots': self.successful_shots,
+            'error_count': self.error_count,
             'brackets': self.session_stats['brackets'],
-            'errors': self.session_stats['errors']
+            'errors': list(self.session_stats['errors'])
         }
         
-        info_file = os.path.join(self.save_directory, 'session_info.json')
-        with open(info_file, 'w') as f:
-            json.dump(session_info, f, indent=2)
+        if self.session_log:
+            self.session_log.log(dict(session_info, type='summary'), flush=True)
+            self.session_log.close()
         
-        print(f"\n📊 Session info saved to: session_info.json")
+        info_file = os.path.join(self.save_directory, 'session_info.json')
+        try:
+            with open(info_file, 'w', encoding='utf-8') as f:
+                json.dump(session_info, f, indent=2)
+            print(f"\n📊 Session info saved to: session_info.json")
+            if self.session_log:
+                print(f"   Per-shot log: session_info.jsonl")
+        except OSError as e:
+            logger.error("Could not save session info %s: %s", info_file, e)
         
         # Next steps
         print("\n" + "="*70)
@@ -542,6 +791,8 @@ class EnhancedMoonCapture:
         
     def cleanup(self):
         """Clean up camera connection"""
+        if self.session_log:
+            self.session_log.close()
         if self.camera:
             try:
                 self.camera.terminate_sdk()
@@ -557,23 +808,15 @@ def show_presets():
     print("="*70)
     
     for i, (name, preset) in enumerate(PRESETS.items(), 1):
-        total_frames = sum(b['frames'] for b in preset['brackets'])
+        total_frames = PRESET_TOTAL_FRAMES[name]
         print(f"\n{i}. {name.upper()}")
         print(f"   {preset['description']}")
         print(f"   Brackets: {len(preset['brackets'])}")
         print(f"   Total frames: {total_frames}")
 
 
-def main():
-    """Main entry point"""
-    print("""
-╔════════════════════════════════════════════════════════════════════╗
-║            ENHANCED MOON PHOTOGRAPHY CAPTURE SCRIPT                ║
-║              Multi-Bracket Stacking & HDR System                   ║
-╚════════════════════════════════════════════════════════════════════╝
-    """)
-    
-    # Choose capture mode
+def select_mode():
+    """Ask for the capture mode; returns True for fast mode, None to exit"""
     print("\n" + "="*70)
     print("SELECT CAPTURE MODE:")
     print("="*70)
@@ -595,22 +838,21 @@ def main():
         
         if mode_num == 3:
             print("Goodbye!")
-            return
+            return None
             
         if mode_num not in [1, 2]:
             print("Invalid choice. Exiting.")
-            return
+            return None
             
-        fast_mode = (mode_num == 2)
+        return mode_num == 2
         
     except ValueError:
         print("Invalid input. Exiting.")
-        return
-    
-    # Show presets
-    show_presets()
-    
-    # Select preset
+        return None
+
+
+def select_preset():
+    """Ask for a preset; returns its name, or None to exit"""
     print("\n" + "="*70)
     print("SELECT PRESET:")
     print("="*70)
@@ -625,20 +867,68 @@ def main():
         
         if choice_num == len(preset_names) + 1:
             print("Goodbye!")
-            return
+            return None
             
         if 1 <= choice_num <= len(preset_names):
-            preset_name = preset_names[choice_num - 1]
-        else:
-            print("Invalid choice. Exiting.")
-            return
+            return preset_names[choice_num - 1]
+            
+        print("Invalid choice. Exiting.")
+        return None
             
     except ValueError:
         print("Invalid input. Exiting.")
-        return
+        return None
+
+
+def parse_args(argv=None):
+    """Parse command line options; anything not given is asked for interactively"""
+    parser = argparse.ArgumentParser(description="Enhanced moon photography capture")
+    parser.add_argument('--mode', choices=['standard', 'fast'],
+                        help="Capture mode (skips the mode menu)")
+    parser.add_argument('--preset', choices=list(PRESETS),
+                        help="Preset to run (skips the preset menu)")
+    parser.add_argument('--yes', action='store_true',
+                        help="Answer yes to every confirmation prompt")
+    parser.add_argument('--on-warn', choices=['ask', 'abort', 'continue'],
+                        help="What to do on warnings such as low card space or "
+                             "unverified settings (default: abort with --yes, otherwise ask)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Main entry point"""
+    args = parse_args(argv)
+    
+    print("""
+╔════════════════════════════════════════════════════════════════════╗
+║            ENHANCED MOON PHOTOGRAPHY CAPTURE SCRIPT                ║
+║              Multi-Bracket Stacking & HDR System                   ║
+╚════════════════════════════════════════════════════════════════════╝
+    """)
+    
+    if args.mode is None:
+        fast_mode = select_mode()
+        if fast_mode is None:
+            return
+    else:
+        fast_mode = args.mode == 'fast'
+    
+    if args.preset is None:
+        # Show presets
+        show_presets()
+        
+        preset_name = select_preset()
+        if preset_name is None:
+            return
+    else:
+        preset_name = args.preset
     
     # Run session
-    session = EnhancedMoonCapture(fast_mode=fast_mode)
+    session = EnhancedMoonCapture(
+        fast_mode=fast_mode,
+        assume_yes=args.yes,
+        on_warn=args.on_warn or ('abort' if args.yes else 'ask')
+    )
     
     try:
         session.setup_camera()
@@ -651,9 +941,8 @@ def main():
             
             # If in fast mode, offer to download captured images
             if fast_mode and session.total_shots > 0:
-                response = input("\nDownload captured images? (y/n): ")
-                if response.lower() == 'y':
-                    session.bulk_download_images()
+                if session.confirm("\nDownload captured images? (y/n): "):
+                    session.bulk_download_images(len(session.background_files))
                     
             session.print_session_summary()
     except Exception as e:
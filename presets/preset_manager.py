@@ -6,17 +6,186 @@ including saving, loading, importing, and exporting presets.
 """
 
 import os
+import copy
 import json
+import time
 import uuid
 import shutil
 import logging
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Written to default_presets/ the first time the manager finds it empty
+_DEFAULT_PRESETS = (
+    {
+        "id": "full_moon",
+        "name": "Full Moon HDR",
+        "description": "High dynamic range capture for full moon",
+        "capture_mode": "standard",
+        "brackets": [
+            {
+                "name": "Highlights",
+                "iso": 100,
+                "aperture": 11,
+                "shutter_speed": "1/500",
+                "frames": 40
+            },
+            {
+                "name": "Normal",
+                "iso": 100,
+                "aperture": 8.0,
+                "shutter_speed": "1/250",
+                "frames": 40
+            },
+            {
+                "name": "Shadows",
+                "iso": 100,
+                "aperture": 5.6,
+                "shutter_speed": "1/125",
+                "frames": 20
+            }
+        ]
+    },
+    {
+        "id": "landscape_hdr",
+        "name": "Landscape HDR",
+        "description": "3-bracket HDR for landscapes",
+        "capture_mode": "standard",
+        "brackets": [
+            {
+                "name": "Underexposed",
+                "iso": 100,
+                "aperture": 11,
+                "shutter_speed": "1/250",
+                "frames": 3
+            },
+            {
+                "name": "Normal",
+                "iso": 100,
+                "aperture": 11,
+                "shutter_speed": "1/60",
+                "frames": 3
+            },
+            {
+                "name": "Overexposed",
+                "iso": 100,
+                "aperture": 11,
+                "shutter_speed": "1/15",
+                "frames": 3
+            }
+        ]
+    },
+    {
+        "id": "quick_stack",
+        "name": "Quick Stack",
+        "description": "Single exposure, 50 frames for stacking",
+        "capture_mode": "fast",
+        "brackets": [
+            {
+                "name": "Main Stack",
+                "iso": 100,
+                "aperture": 8.0,
+                "shutter_speed": "1/250",
+                "frames": 50
+            }
+        ]
+    },
+    {
+        "id": "focus_stack",
+        "name": "Focus Stack",
+        "description": "Focus stacking for macro photography",
+        "capture_mode": "standard",
+        "brackets": [
+            {
+                "name": "Focus Stack",
+                "iso": 100,
+                "aperture": 8.0,
+                "shutter_speed": "1/60",
+                "frames": 10
+            }
+        ],
+        "focus_stack": {
+            "enabled": True,
+            "steps": 10,
+            "step_size": 3
+        }
+    }
+)
+
+
+def _read_json(path):
+    """Parse a JSON file, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _encode_json(data):
+    """Encode data as indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _write_bytes(path, raw):
+    """
+    Write raw bytes to path atomically
+    
+    The data goes to a uniquely named temporary file next to path, which is
+    synced and then renamed over it, so readers see either the old file or
+    the new one and never a partly written preset. Concurrent writers of
+    the same path each use their own temporary file; the last rename wins.
+    """
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix='.tmp', dir=directory or None)
+    try:
+        try:
+            view = memoryview(raw)
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        # mkstemp creates the file owner-only
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _log_load_errors(preset_type, errors):
+    """Log the failures collected during one preset walk as a single message"""
+    details = "; ".join(f"{path}: {e}" for path, e in errors[:5])
+    more = f" (and {len(errors) - 5} more)" if len(errors) > 5 else ""
+    logger.error(f"Failed to load {len(errors)} {preset_type} preset path(s): {details}{more}")
+
+
+def _write_json(path, data):
+    """Write data as indented JSON"""
+    _write_bytes(path, _encode_json(data))
+
+
 class PresetManager:
     """Manager for exposure bracket presets"""
     
+    # Cold listings with at least this many unparsed files are read in parallel
+    PARALLEL_READ_MIN = 16
+    READ_WORKERS = 8
+    
     def __init__(self, preset_dir="presets"):
         """
         Initialize the preset manager
@@ -27,12 +196,22 @@ class PresetManager:
         self.preset_dir = preset_dir
         self.default_dir = os.path.join(preset_dir, "default_presets")
         self.user_dir = os.path.join(preset_dir, "user_presets")
+        self.exports_dir = os.path.join(preset_dir, "exports")
+        
+        # Parsed preset files, keyed by path: ((mtime_ns, size), preset)
+        self._cache = {}
+        # Where each known preset lives: preset_id -> (path, type, folder)
+        self._index = {}
+        # Last sorted get_all_presets() result: (tree stamp, presets)
+        self._listing = None
+        # User preset folders known to exist on disk
+        self._known_folders = set()
+        # Last timestamp formatted by _timestamp(): (second, text)
+        self._last_stamp = (None, '')
         
         # Create directories if they don't exist
-        for directory in [self.preset_dir, self.default_dir, self.user_dir]:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
-                logger.info(f"Created directory: {directory}")
+        for directory in [self.preset_dir, self.default_dir, self.user_dir, self.exports_dir]:
+            os.makedirs(directory, exist_ok=True)
         
         # Load default presets
         self._load_default_presets()
@@ -41,123 +220,37 @@ class PresetManager:
     
     def _load_default_presets(self):
         """Load default presets if none exist"""
-        # Check if default presets directory is empty
-        if not os.listdir(self.default_dir):
+        # Check if default presets directory is empty; one entry is enough
+        with os.scandir(self.default_dir) as entries:
+            empty = next(entries, None) is None
+        if empty:
             logger.info("Creating default presets")
             self._create_default_presets()
     
     def _create_default_presets(self):
         """Create default presets"""
-        default_presets = [
-            {
-                "id": "full_moon",
-                "name": "Full Moon HDR",
-                "description": "High dynamic range capture for full moon",
-                "capture_mode": "standard",
-                "brackets": [
-                    {
-                        "name": "Highlights",
-                        "iso": 100,
-                        "aperture": 11,
-                        "shutter_speed": "1/500",
-                        "frames": 40
-                    },
-                    {
-                        "name": "Normal",
-                        "iso": 100,
-                        "aperture": 8.0,
-                        "shutter_speed": "1/250",
-                        "frames": 40
-                    },
-                    {
-                        "name": "Shadows",
-                        "iso": 100,
-                        "aperture": 5.6,
-                        "shutter_speed": "1/125",
-                        "frames": 20
-                    }
-                ]
-            },
-            {
-                "id": "landscape_hdr",
-                "name": "Landscape HDR",
-                "description": "3-bracket HDR for landscapes",
-                "capture_mode": "standard",
-                "brackets": [
-                    {
-                        "name": "Underexposed",
-                        "iso": 100,
-                        "aperture": 11,
-                        "shutter_speed": "1/250",
-                        "frames": 3
-                    },
-                    {
-                        "name": "Normal",
-                        "iso": 100,
-                        "aperture": 11,
-                        "shutter_speed": "1/60",
-                        "frames": 3
-                    },
-                    {
-                        "name": "Overexposed",
-                        "iso": 100,
-                        "aperture": 11,
-                        "shutter_speed": "1/15",
-                        "frames": 3
-                    }
-                ]
-            },
-            {
-                "id": "quick_stack",
-                "name": "Quick Stack",
-                "description": "Single exposure, 50 frames for stacking",
-                "capture_mode": "fast",
-                "brackets": [
-                    {
-                        "name": "Main Stack",
-                        "iso": 100,
-                        "aperture": 8.0,
-                        "shutter_speed": "1/250",
-                        "frames": 50
-                    }
-                ]
-            },
-            {
-                "id": "focus_stack",
-                "name": "Focus Stack",
-                "description": "Focus stacking for macro photography",
-                "capture_mode": "standard",
-                "brackets": [
-                    {
-                        "name": "Focus Stack",
-                        "iso": 100,
-                        "aperture": 8.0,
-                        "shutter_speed": "1/60",
-                        "frames": 10
-                    }
-                ],
-                "focus_stack": {
-                    "enabled": True,
-                    "steps": 10,
-                    "step_size": 3
-                }
-            }
-        ]
-        
-        # Save default presets
-        for preset in default_presets:
+        # Encode everything first, then write the files back to back
+        encoded = [(preset, _encode_json(preset)) for preset in _DEFAULT_PRESETS]
+        for preset, raw in encoded:
             preset_path = os.path.join(self.default_dir, f"{preset['id']}.json")
-            with open(preset_path, 'w') as f:
-                json.dump(preset, f, indent=2)
+            _write_bytes(preset_path, raw)
             logger.info(f"Created default preset: {preset['name']}")
     
     def get_all_presets(self):
         """
         Get all available presets, including those in subdirectories
         
+        The sorted list is reused until a preset file is added, removed or
+        modified, whether by this manager or outside it. Callers always get
+        deep copies, so they can edit the result freely.
+        
         Returns:
             list: List of preset dictionaries with folder information
         """
+        stamp = self._tree_stamp()
+        if self._listing is not None and self._listing[0] == stamp:
+            return copy.deepcopy(self._listing[1])
+        
         presets = []
         
         # Load default presets
@@ -172,11 +265,41 @@ class PresetManager:
         presets.sort(key=lambda x: (x.get('folder', ''), x.get('name', '')))
         
         logger.info(f"Loaded {len(presets)} presets")
-        return presets
+        self._listing = (stamp, presets)
+        return copy.deepcopy(presets)
+    
+    def _tree_stamp(self):
+        """
+        Path, mtime and size of every preset file, used to spot changes
+        
+        Only directory entries are read; on Windows scandir already carries
+        the stat data, so no file is opened or stat'ed separately.
+        """
+        stamp = []
+        pending = deque([self.default_dir, self.user_dir])
+        
+        while pending:
+            try:
+                with os.scandir(pending.popleft()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith('.json'):
+                            stat = entry.stat()
+                            stamp.append((entry.path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                pass
+        
+        return frozenset(stamp)
     
     def _load_presets_from_dir(self, directory, preset_type, relative_path=''):
         """
-        Recursively load presets from a directory and its subdirectories
+        Load presets from a directory and its subdirectories
+        
+        Directories are walked breadth-first with os.scandir, whose entries
+        already know whether they are directories, so no extra stat is
+        needed per file. When many files are not cached yet they are read
+        on a small thread pool so the reads overlap.
         
         Args:
             directory: Base directory to load from
@@ -186,37 +309,48 @@ class PresetManager:
         Returns:
             list: List of preset dictionaries
         """
-        presets = []
-        full_path = os.path.join(directory, relative_path)
+        files = []
+        errors = []
+        sep = os.sep
+        pending = deque([(os.path.join(directory, relative_path), relative_path)])
+        
+        while pending:
+            full_path, relative_path = pending.popleft()
+            try:
+                with os.scandir(full_path) as entries:
+                    for entry in entries:
+                        # Subdirectories are loaded after this directory
+                        if entry.is_dir(follow_symlinks=False):
+                            subfolder_path = f"{relative_path}{sep}{entry.name}" if relative_path else entry.name
+                            pending.append((entry.path, subfolder_path))
+                            if preset_type == 'user':
+                                self._known_folders.add(subfolder_path)
+                        
+                        # If it's a JSON file, load it as a preset
+                        elif entry.name.endswith('.json'):
+                            files.append((entry.path, relative_path))
+            except Exception as e:
+                errors.append((full_path, e))
         
+        cache = self._cache
+        cold = sum(1 for path, _ in files if path not in cache)
+        if cold >= self.PARALLEL_READ_MIN:
+            with ThreadPoolExecutor(max_workers=self.READ_WORKERS) as pool:
+                results = list(pool.map(lambda f: self._try_read_preset(f[0], preset_type, f[1], errors), files))
+        else:
+            results = [self._try_read_preset(path, preset_type, folder, errors) for path, folder in files]
+        
+        if errors:
+            _log_load_errors(preset_type, errors)
+        return [preset for preset in results if preset is not None]
+    
+    def _try_read_preset(self, path, preset_type, relative_path, errors):
+        """Read a preset for a listing, recording files that fail in errors"""
         try:
-            for item in os.listdir(full_path):
-                item_path = os.path.join(full_path, item)
-                
-                # If it's a directory, recursively load presets from it
-                if os.path.isdir(item_path):
-                    subfolder_path = os.path.join(relative_path, item) if relative_path else item
-                    subfolder_presets = self._load_presets_from_dir(directory, preset_type, subfolder_path)
-                    presets.extend(subfolder_presets)
-                
-                # If it's a JSON file, load it as a preset
-                elif item.endswith('.json'):
-                    try:
-                        with open(item_path, 'r') as f:
-                            preset = json.load(f)
-                            preset['type'] = preset_type
-                            
-                            # Add folder information
-                            if relative_path:
-                                preset['folder'] = relative_path
-                            
-                            presets.append(preset)
-                    except Exception as e:
-                        logger.error(f"Error loading {preset_type} preset {item_path}: {e}")
+            return self._read_preset(path, preset_type, relative_path)
         except Exception as e:
-            logger.error(f"Error accessing directory {full_path}: {e}")
-        
-        return presets
+            errors.append((path, e))
+            return None
     
     def get_preset(self, preset_id):
         """
@@ -228,24 +362,31 @@ class PresetManager:
         Returns:
             dict: Preset dictionary or None if not found
         """
-        # First try to find the preset in the default and user directories
-        default_path = os.path.join(self.default_dir, f"{preset_id}.json")
-        if os.path.exists(default_path):
+        # Presets seen before are read straight from their known path
+        known = self._index.get(preset_id)
+        if known is not None:
             try:
-                with open(default_path, 'r') as f:
-                    preset = json.load(f)
-                    preset['type'] = 'default'
-                    return preset
-            except Exception as e:
-                logger.error(f"Error loading default preset {preset_id}: {e}")
+                return self._read_preset(*known)
+            except Exception:
+                # Moved or removed outside the manager; search again
+                self._index.pop(preset_id, None)
+        
+        # First try to find the preset in the default and user directories.
+        # Saved and imported presets get uuid4 ids, which the slug-named
+        # defaults never use, so those skip the default_dir probe.
+        filename = f"{preset_id}.json"
+        if not (len(preset_id) == 36 and preset_id.count('-') == 4):
+            default_path = os.path.join(self.default_dir, filename)
+            if os.path.exists(default_path):
+                try:
+                    return self._read_preset(default_path, 'default')
+                except Exception as e:
+                    logger.error(f"Error loading default preset {preset_id}: {e}")
         
-        user_path = os.path.join(self.user_dir, f"{preset_id}.json")
+        user_path = os.path.join(self.user_dir, filename)
         if os.path.exists(user_path):
             try:
-                with open(user_path, 'r') as f:
-                    preset = json.load(f)
-                    preset['type'] = 'user'
-                    return preset
+                return self._read_preset(user_path, 'user')
             except Exception as e:
                 logger.error(f"Error loading user preset {preset_id}: {e}")
         
@@ -263,7 +404,10 @@ class PresetManager:
     
     def _find_preset_in_subdirs(self, base_dir, preset_id, preset_type, relative_path=''):
         """
-        Recursively search for a preset in subdirectories
+        Search for a preset in a directory and its subdirectories
+        
+        The search is breadth-first, so it stops as soon as the file turns
+        up without descending into folders that come after it.
         
         Args:
             base_dir: Base directory to search in
@@ -274,38 +418,91 @@ class PresetManager:
         Returns:
             dict: Preset dictionary or None if not found
         """
-        full_path = os.path.join(base_dir, relative_path)
+        target = f"{preset_id}.json"
+        errors = []
+        sep = os.sep
+        pending = deque([(os.path.join(base_dir, relative_path), relative_path)])
         
-        try:
-            for item in os.listdir(full_path):
-                item_path = os.path.join(full_path, item)
-                
-                # If it's a directory, search recursively
-                if os.path.isdir(item_path):
-                    subfolder_path = os.path.join(relative_path, item) if relative_path else item
-                    preset = self._find_preset_in_subdirs(base_dir, preset_id, preset_type, subfolder_path)
-                    if preset:
-                        return preset
-                
-                # If it's a JSON file with the matching ID, load it
-                elif item == f"{preset_id}.json":
-                    try:
-                        with open(item_path, 'r') as f:
-                            preset = json.load(f)
-                            preset['type'] = preset_type
-                            
-                            # Add folder information
-                            if relative_path:
-                                preset['folder'] = relative_path
-                            
-                            return preset
-                    except Exception as e:
-                        logger.error(f"Error loading {preset_type} preset {item_path}: {e}")
-        except Exception as e:
-            logger.error(f"Error accessing directory {full_path}: {e}")
+        while pending:
+            full_path, relative_path = pending.popleft()
+            try:
+                with os.scandir(full_path) as entries:
+                    for entry in entries:
+                        # Subdirectories are searched after this directory
+                        if entry.is_dir(follow_symlinks=False):
+                            subfolder_path = f"{relative_path}{sep}{entry.name}" if relative_path else entry.name
+                            pending.append((entry.path, subfolder_path))
+                        
+                        # If it's the JSON file with the matching ID, load it
+                        elif entry.name == target:
+                            preset = self._try_read_preset(entry.path, preset_type, relative_path, errors)
+                            if preset is not None:
+                                return preset
+            except Exception as e:
+                errors.append((full_path, e))
         
+        if errors:
+            _log_load_errors(preset_type, errors)
         return None
     
+    def _read_preset(self, path, preset_type, relative_path=''):
+        """
+        Load a preset file, reusing the parsed copy while the file is unchanged
+        
+        Args:
+            path: Path to the preset file
+            preset_type: Type of preset ('default' or 'user')
+            relative_path: Folder of the preset relative to its base directory
+            
+        Returns:
+            dict: A new preset dictionary with type and folder information
+        """
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            data = cached[1]
+        else:
+            data = _read_json(path)
+            self._cache[path] = (stamp, data)
+        
+        self._index[os.path.basename(path)[:-len('.json')]] = (path, preset_type, relative_path)
+        
+        # Callers get their own deep copy, so edits to nested brackets
+        # never reach the cached data
+        preset = copy.deepcopy(data)
+        preset['type'] = preset_type
+        
+        # Add folder information
+        if relative_path:
+            preset['folder'] = relative_path
+        
+        return preset
+    
+    def _forget_preset(self, preset_id, path):
+        """Drop a preset from the cache and index after it was written or removed"""
+        self._cache.pop(path, None)
+        self._index.pop(preset_id, None)
+        self._listing = None
+    
+    def _timestamp(self):
+        """
+        Get the local time formatted as YYYYmmdd_HHMMSS
+        
+        The text is formatted at most once per second and reused by later
+        calls in the same second. The cached pair is replaced as a whole,
+        so concurrent callers never see a mismatched second and text.
+        
+        Returns:
+            str: Timestamp text
+        """
+        second = int(time.time())
+        last_second, text = self._last_stamp
+        if second != last_second:
+            text = time.strftime('%Y%m%d_%H%M%S', time.localtime(second))
+            self._last_stamp = (second, text)
+        return text
+    
     def save_preset(self, preset_data):
         """
         Save a preset
@@ -323,24 +520,35 @@ class PresetManager:
             
             # Ensure required fields
             if 'name' not in preset_data:
-                preset_data['name'] = f"Preset {datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                preset_data['name'] = f"Preset {self._timestamp()}"
             
             if 'brackets' not in preset_data or not preset_data['brackets']:
                 raise ValueError("Preset must contain at least one bracket")
             
             # Determine save directory (handle folders)
             save_dir = self.user_dir
-            if 'folder' in preset_data and preset_data['folder']:
-                folder_path = os.path.join(self.user_dir, preset_data['folder'])
-                # Create folder if it doesn't exist
-                if not os.path.exists(folder_path):
-                    os.makedirs(folder_path)
+            folder = preset_data.get('folder')
+            if folder:
+                folder_path = os.path.join(self.user_dir, folder)
+                # Create folder if it isn't known to exist yet
+                if folder not in self._known_folders:
+                    os.makedirs(folder_path, exist_ok=True)
+                    self._known_folders.add(folder)
                 save_dir = folder_path
             
             # Save to appropriate directory
             preset_path = os.path.join(save_dir, f"{preset_data['id']}.json")
-            with open(preset_path, 'w') as f:
-                json.dump(preset_data, f, indent=2)
+            try:
+                _write_json(preset_path, preset_data)
+            except FileNotFoundError:
+                if not folder:
+                    raise
+                # Folder was removed outside the manager; recreate it
+                os.makedirs(folder_path, exist_ok=True)
+                _write_json(preset_path, preset_data)
+            self._cache.pop(preset_path, None)
+            self._listing = None
+            self._index[preset_data['id']] = (preset_path, 'user', folder or '')
             
             logger.info(f"Saved preset: {preset_data['name']} ({preset_data['id']})")
             return preset_data['id']
@@ -366,10 +574,25 @@ class PresetManager:
                 logger.warning(f"Cannot delete default preset: {preset_id}")
                 return False
             
+            # Known presets are removed straight from their indexed path
+            known = self._index.get(preset_id)
+            if known is not None and known[1] == 'user':
+                preset_path = known[0]
+                try:
+                    os.remove(preset_path)
+                except FileNotFoundError:
+                    # Removed outside the manager; fall back to searching
+                    self._forget_preset(preset_id, preset_path)
+                else:
+                    self._forget_preset(preset_id, preset_path)
+                    logger.info(f"Deleted preset: {preset_id}")
+                    return True
+            
             # Check if it's a user preset in the root directory
             user_path = os.path.join(self.user_dir, f"{preset_id}.json")
             if os.path.exists(user_path):
                 os.remove(user_path)
+                self._forget_preset(preset_id, user_path)
                 logger.info(f"Deleted preset: {preset_id}")
                 return True
             
@@ -382,6 +605,7 @@ class PresetManager:
                 
                 if os.path.exists(preset_path):
                     os.remove(preset_path)
+                    self._forget_preset(preset_id, preset_path)
                     logger.info(f"Deleted preset: {preset_id} from folder: {preset['folder']}")
                     return True
             
@@ -437,18 +661,12 @@ class PresetManager:
                 logger.warning(f"Preset not found: {preset_id}")
                 return None
             
-            # Create exports directory if it doesn't exist
-            exports_dir = os.path.join(self.preset_dir, "exports")
-            if not os.path.exists(exports_dir):
-                os.makedirs(exports_dir)
-            
-            # Create export filename
+            # Create export filename; exports_dir is created in __init__
             safe_name = preset.get('name', 'preset').replace(' ', '_').lower()
-            export_path = os.path.join(exports_dir, f"{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+            export_path = os.path.join(self.exports_dir, f"{safe_name}_{self._timestamp()}.json")
             
             # Save to file
-            with open(export_path, 'w') as f:
-                json.dump(preset, f, indent=2)
+            _write_json(export_path, preset)
             
             logger.info(f"Exported preset {preset_id} to {export_path}")
             return export_path
@@ -468,17 +686,16 @@ class PresetManager:
             str: New preset ID or None if failed
         """
         try:
-            # Get preset
-            preset = self.get_preset(preset_id)
-            if not preset:
+            # Get preset; known presets are read from the index and parse cache
+            new_preset = self.get_preset(preset_id)
+            if not new_preset:
                 logger.warning(f"Preset not found: {preset_id}")
                 return None
             
-            # Create a copy
-            new_preset = preset.copy()
+            # get_preset already returns a fresh dict, so edit it in place
             new_preset.pop('id', None)
             new_preset.pop('type', None)
-            new_preset['name'] = f"Copy of {preset.get('name', 'Preset')}"
+            new_preset['name'] = f"Copy of {new_preset.get('name', 'Preset')}"
             
             # Save as new preset
             return self.save_preset(new_preset)